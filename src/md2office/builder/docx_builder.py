@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from io import BytesIO
 from pathlib import Path
 from typing import BinaryIO
@@ -17,10 +18,7 @@ from md2office.builder.list_builder import ListBuilder
 from md2office.builder.style_mapper import StyleMapper
 from md2office.builder.table_builder import TableBuilder
 from md2office.core.config import StylesConfig
-from md2office.core.exceptions import BuilderError
-from md2office.parser.elements import (
-    Document as ASTDocument,
-)
+from md2office.core.exceptions import BuilderError, ParserError
 from md2office.parser.elements import (
     DocxAdmonition,
     DocxBlockquote,
@@ -35,6 +33,15 @@ from md2office.parser.elements import (
     TextSpan,
 )
 
+# Clark-notation attribute and tag names used per element, resolved once
+_W_ID = qn("w:id")
+_W_NAME = qn("w:name")
+_W_ANCHOR = qn("w:anchor")
+_R_ID = qn("r:id")
+_W_VAL = qn("w:val")
+_W_ASCII = qn("w:ascii")
+_W_HANSI = qn("w:hAnsi")
+
 
 class DocxBuilder:
     """Builds Word documents from DOCX AST elements."""
@@ -106,8 +113,8 @@ class DocxBuilder:
 
         # Create bookmarkStart element
         bookmark_start = OxmlElement("w:bookmarkStart")
-        bookmark_start.set(qn("w:id"), str(bookmark_id))
-        bookmark_start.set(qn("w:name"), anchor)
+        bookmark_start.set(_W_ID, str(bookmark_id))
+        bookmark_start.set(_W_NAME, anchor)
 
         # Insert at the beginning of the paragraph
         paragraph._p.insert(0, bookmark_start)
@@ -126,22 +133,24 @@ class DocxBuilder:
 
         # Create bookmarkEnd element
         bookmark_end = OxmlElement("w:bookmarkEnd")
-        bookmark_end.set(qn("w:id"), str(bookmark_id))
+        bookmark_end.set(_W_ID, str(bookmark_id))
 
         # Append at the end of the paragraph
         paragraph._p.append(bookmark_end)
 
-    def build(self, elements: ASTDocument) -> Document:
+    def build(self, elements: Iterable[DocxElement]) -> Document:
         """Build a Word document from AST elements.
 
         Args:
-            elements: List of DocxElement objects.
+            elements: List of DocxElement objects, or an iterator such as
+                MarkdownParser.iter_elements() to build while parsing.
 
         Returns:
             Word Document object.
 
         Raises:
             BuilderError: If building fails.
+            ParserError: If parsing fails while iterating elements.
         """
         try:
             self._init_document()
@@ -151,10 +160,12 @@ class DocxBuilder:
                 self._build_element(element)
 
             return self._document
+        except ParserError:
+            raise
         except Exception as e:
             raise BuilderError(f"Failed to build document: {e}") from e
 
-    def build_to_file(self, elements: ASTDocument, output_path: Path | str) -> Path:
+    def build_to_file(self, elements: Iterable[DocxElement], output_path: Path | str) -> Path:
         """Build and save a Word document to a file.
 
         Args:
@@ -170,7 +181,7 @@ class DocxBuilder:
         document.save(output_path)
         return output_path
 
-    def build_to_bytes(self, elements: ASTDocument) -> bytes:
+    def build_to_bytes(self, elements: Iterable[DocxElement]) -> bytes:
         """Build a Word document and return as bytes.
 
         Args:
@@ -184,7 +195,7 @@ class DocxBuilder:
         document.save(buffer)
         return buffer.getvalue()
 
-    def build_to_stream(self, elements: ASTDocument, stream: BinaryIO) -> None:
+    def build_to_stream(self, elements: Iterable[DocxElement], stream: BinaryIO) -> None:
         """Build a Word document and write to a stream.
 
         Args:
@@ -472,7 +483,7 @@ class DocxBuilder:
         if span.link and span.link.startswith("#"):
             # Internal link - use w:anchor attribute
             anchor_name = span.link[1:]  # Remove the leading #
-            hyperlink.set(qn("w:anchor"), anchor_name)
+            hyperlink.set(_W_ANCHOR, anchor_name)
         else:
             # External link - use r:id relationship
             part = paragraph.part
@@ -481,7 +492,7 @@ class DocxBuilder:
                 "http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink",
                 is_external=True,
             )
-            hyperlink.set(qn("r:id"), r_id)
+            hyperlink.set(_R_ID, r_id)
 
         # Create the run element inside the hyperlink
         new_run = OxmlElement("w:r")
@@ -501,22 +512,22 @@ class DocxBuilder:
 
         # Underline (standard for hyperlinks)
         underline = OxmlElement("w:u")
-        underline.set(qn("w:val"), "single")
+        underline.set(_W_VAL, "single")
         rPr.append(underline)
 
         # Blue color (standard for hyperlinks)
         color = OxmlElement("w:color")
-        color.set(qn("w:val"), "0563C1")
+        color.set(_W_VAL, "0563C1")
         rPr.append(color)
 
         # Code formatting
         if span.code:
             font = OxmlElement("w:rFonts")
-            font.set(qn("w:ascii"), "Consolas")
-            font.set(qn("w:hAnsi"), "Consolas")
+            font.set(_W_ASCII, "Consolas")
+            font.set(_W_HANSI, "Consolas")
             rPr.append(font)
             size = OxmlElement("w:sz")
-            size.set(qn("w:val"), "20")  # 10pt = 20 half-points
+            size.set(_W_VAL, "20")  # 10pt = 20 half-points
             rPr.append(size)
 
         # Strikethrough
@@ -11,7 +11,20 @@ from docx.shared import Pt, RGBColor
 from docx.table import Table, _Cell
 
 from md2office.builder.style_mapper import StyleMapper
-from md2office.parser.elements import DocxTable, TextSpan
+from md2office.parser.elements import DocxTable, DocxTableRow, TextSpan
+
+# Clark-notation attribute and tag names used per element, resolved once
+_W_FILL = qn("w:fill")
+_W_VAL = qn("w:val")
+_W_W = qn("w:w")
+_W_TYPE = qn("w:type")
+_W_VALIGN = qn("w:vAlign")
+_W_TCMAR = qn("w:tcMar")
+_W_HRULE = qn("w:hRule")
+_W_TRHEIGHT = qn("w:trHeight")
+_R_ID = qn("r:id")
+_W_ASCII = qn("w:ascii")
+_W_HANSI = qn("w:hAnsi")
 
 
 class TableBuilder:
@@ -56,16 +69,18 @@ class TableBuilder:
         # Get table formatting config
         config = self._style_mapper.table_config()
 
-        # Track merged cells to skip filling
-        merged_cells: set[tuple[int, int]] = set()
+        # Per-row merge bitmasks (bit i set = cell i is a merge marker)
+        masks = [self._row_merge_masks(row) for row in table_element.rows]
 
-        # First pass: identify cells to merge and perform merges
-        self._process_cell_merges(table_element, table, merged_cells)
+        # First pass: perform merges
+        self._process_cell_merges(table_element, table, masks)
 
         # Second pass: fill table cells
         for row_idx, row in enumerate(table_element.rows):
             is_header_row = row_idx == 0 and table_element.has_header
             word_row = table.rows[row_idx]
+            vmerge_mask, hmerge_mask = masks[row_idx]
+            skip_mask = vmerge_mask | hmerge_mask
 
             # Set minimum row height for vertical centering to be visible
             # 400 twips = 20pt minimum height
@@ -75,12 +90,9 @@ class TableBuilder:
                 if col_idx >= num_cols:
                     break
 
-                # Skip cells that are part of a merged region (not the origin)
-                if (row_idx, col_idx) in merged_cells:
-                    continue
-
-                # Skip cells marked for merge_up or merge_left
-                if cell.merge_up or cell.merge_left:
+                # Skip cells marked for merge_up or merge_left; they are either
+                # part of a merged region or have no origin to merge into
+                if skip_mask >> col_idx & 1:
                     continue
 
                 table_cell = word_row.cells[col_idx]
@@ -93,86 +105,105 @@ class TableBuilder:
 
         return table
 
+    def _row_merge_masks(self, row: DocxTableRow) -> tuple[int, int]:
+        """Get the vertical and horizontal merge bitmasks of a row.
+
+        Rows produced by the parser carry precomputed masks; rows built by
+        hand that only set the per-cell flags get them derived here.
+
+        Args:
+            row: Source table row.
+
+        Returns:
+            Tuple of (vmerge_mask, hmerge_mask).
+        """
+        if row.vmerge_mask or row.hmerge_mask:
+            return row.vmerge_mask, row.hmerge_mask
+
+        vmerge_mask = 0
+        hmerge_mask = 0
+        for col_idx, cell in enumerate(row.cells):
+            if cell.merge_up:
+                vmerge_mask |= 1 << col_idx
+            if cell.merge_left:
+                hmerge_mask |= 1 << col_idx
+        return vmerge_mask, hmerge_mask
+
     def _process_cell_merges(
         self,
         table_element: DocxTable,
         table: Table,
-        merged_cells: set[tuple[int, int]],
+        masks: list[tuple[int, int]],
     ) -> None:
         """Process cell merges (rowspan and colspan).
 
+        Only the set bits of each row's merge masks are visited, so rows
+        without merge markers cost a single integer test.
+
         Args:
             table_element: Source table element.
             table: Word table to apply merges to.
-            merged_cells: Set to track merged cell positions.
+            masks: Per-row (vmerge_mask, hmerge_mask) tuples.
         """
-        num_rows = len(table_element.rows)
-        num_cols = max(len(row.cells) for row in table_element.rows) if table_element.rows else 0
-
-        # Process vertical merges (cells with merge_up=True)
-        for col_idx in range(num_cols):
-            row_idx = 0
-            while row_idx < num_rows:
-                row = table_element.rows[row_idx]
-                if col_idx >= len(row.cells):
-                    row_idx += 1
+        rows = table_element.rows
+
+        # Process vertical merges: column -> [origin_row, last_row]
+        open_runs: dict[int, list[int]] = {}
+        vertical_runs: list[tuple[int, int, int]] = []
+        prev_vmask = 0
+        for row_idx, (vmask, _) in enumerate(masks):
+            # Close runs that do not continue into this row
+            for col_idx in [c for c in open_runs if not vmask >> c & 1]:
+                origin, last = open_runs.pop(col_idx)
+                vertical_runs.append((col_idx, origin, last))
+
+            mask = vmask
+            while mask:
+                low = mask & -mask
+                col_idx = low.bit_length() - 1
+                mask ^= low
+
+                run = open_runs.get(col_idx)
+                if run is not None:
+                    run[1] = row_idx
+                elif (
+                    row_idx > 0
+                    and col_idx < len(rows[row_idx - 1].cells)
+                    and not prev_vmask & low
+                ):
+                    # The cell above is a regular cell: it becomes the origin
+                    open_runs[col_idx] = [row_idx - 1, row_idx]
+            prev_vmask = vmask
+
+        for col_idx, (origin, last) in open_runs.items():
+            vertical_runs.append((col_idx, origin, last))
+
+        for col_idx, origin, last in vertical_runs:
+            start_cell = table.rows[origin].cells[col_idx]
+            end_cell = table.rows[last].cells[col_idx]
+            start_cell.merge(end_cell)
+
+        # Process horizontal merges: runs of consecutive set bits extend the
+        # regular cell immediately to their left
+        for row_idx, (_, hmask) in enumerate(masks):
+            # Bit 0 has no cell to its left and can never merge
+            mask = hmask & ~1
+            while mask:
+                low = mask & -mask
+                start_col = low.bit_length() - 1
+                if hmask & (low >> 1):
+                    # Continuation of a run without origin (starts at column 0)
+                    mask ^= low
                     continue
+                # Walk to the end of this run of consecutive bits
+                end_col = start_col
+                while hmask >> (end_col + 1) & 1:
+                    end_col += 1
+                mask &= ~((1 << (end_col + 1)) - 1)
 
-                cell = row.cells[col_idx]
-
-                # If not a merge_up cell, check how many merge_up cells follow
-                if not cell.merge_up:
-                    merge_count = 0
-                    check_row = row_idx + 1
-                    while check_row < num_rows:
-                        check_row_cells = table_element.rows[check_row].cells
-                        if col_idx >= len(check_row_cells):
-                            break
-                        if check_row_cells[col_idx].merge_up:
-                            merge_count += 1
-                            merged_cells.add((check_row, col_idx))
-                            check_row += 1
-                        else:
-                            break
-
-                    # Perform vertical merge if needed
-                    if merge_count > 0:
-                        start_cell = table.rows[row_idx].cells[col_idx]
-                        end_cell = table.rows[row_idx + merge_count].cells[col_idx]
-                        start_cell.merge(end_cell)
-
-                    row_idx = check_row
-                else:
-                    row_idx += 1
-
-        # Process horizontal merges (cells with merge_left=True)
-        for row_idx in range(num_rows):
-            row = table_element.rows[row_idx]
-            col_idx = 0
-            while col_idx < len(row.cells):
-                cell = row.cells[col_idx]
-
-                # If not a merge_left cell, check how many merge_left cells follow
-                if not cell.merge_left:
-                    merge_count = 0
-                    check_col = col_idx + 1
-                    while check_col < len(row.cells):
-                        if row.cells[check_col].merge_left:
-                            merge_count += 1
-                            merged_cells.add((row_idx, check_col))
-                            check_col += 1
-                        else:
-                            break
-
-                    # Perform horizontal merge if needed
-                    if merge_count > 0:
-                        start_cell = table.rows[row_idx].cells[col_idx]
-                        end_cell = table.rows[row_idx].cells[col_idx + merge_count]
-                        start_cell.merge(end_cell)
-
-                    col_idx = check_col
-                else:
-                    col_idx += 1
+                start_cell = table.rows[row_idx].cells[start_col - 1]
+                end_cell = table.rows[row_idx].cells[end_col]
+                start_cell.merge(end_cell)
 
     def _fill_cell(
         self,
@@ -232,7 +263,7 @@ class TableBuilder:
         tc = cell._tc
         tc_pr = tc.get_or_add_tcPr()
         shd = OxmlElement("w:shd")
-        shd.set(qn("w:fill"), color)
+        shd.set(_W_FILL, color)
         tc_pr.append(shd)
 
     def _set_row_bg_color(self, row, color: str) -> None:
@@ -255,11 +286,11 @@ class TableBuilder:
         tc = cell._tc
         tc_pr = tc.get_or_add_tcPr()
         # Remove any existing vAlign element
-        for existing in tc_pr.findall(qn("w:vAlign")):
+        for existing in tc_pr.findall(_W_VALIGN):
             tc_pr.remove(existing)
         # Add new vAlign element
         v_align = OxmlElement("w:vAlign")
-        v_align.set(qn("w:val"), alignment)
+        v_align.set(_W_VAL, alignment)
         tc_pr.append(v_align)
 
     def _set_cell_margins(self, cell: _Cell, top: int = 0, bottom: int = 0, left: int = 0, right: int = 0) -> None:
@@ -275,29 +306,29 @@ class TableBuilder:
         tc = cell._tc
         tc_pr = tc.get_or_add_tcPr()
         # Remove any existing tcMar element
-        for existing in tc_pr.findall(qn("w:tcMar")):
+        for existing in tc_pr.findall(_W_TCMAR):
             tc_pr.remove(existing)
         # Add new tcMar element
         tc_mar = OxmlElement("w:tcMar")
         if top:
             top_elem = OxmlElement("w:top")
-            top_elem.set(qn("w:w"), str(top))
-            top_elem.set(qn("w:type"), "dxa")
+            top_elem.set(_W_W, str(top))
+            top_elem.set(_W_TYPE, "dxa")
             tc_mar.append(top_elem)
         if bottom:
             bottom_elem = OxmlElement("w:bottom")
-            bottom_elem.set(qn("w:w"), str(bottom))
-            bottom_elem.set(qn("w:type"), "dxa")
+            bottom_elem.set(_W_W, str(bottom))
+            bottom_elem.set(_W_TYPE, "dxa")
             tc_mar.append(bottom_elem)
         if left:
             left_elem = OxmlElement("w:left")
-            left_elem.set(qn("w:w"), str(left))
-            left_elem.set(qn("w:type"), "dxa")
+            left_elem.set(_W_W, str(left))
+            left_elem.set(_W_TYPE, "dxa")
             tc_mar.append(left_elem)
         if right:
             right_elem = OxmlElement("w:right")
-            right_elem.set(qn("w:w"), str(right))
-            right_elem.set(qn("w:type"), "dxa")
+            right_elem.set(_W_W, str(right))
+            right_elem.set(_W_TYPE, "dxa")
             tc_mar.append(right_elem)
         tc_pr.append(tc_mar)
 
@@ -312,12 +343,12 @@ class TableBuilder:
         tr = row._tr
         tr_pr = tr.get_or_add_trPr()
         # Remove any existing trHeight element
-        for existing in tr_pr.findall(qn("w:trHeight")):
+        for existing in tr_pr.findall(_W_TRHEIGHT):
             tr_pr.remove(existing)
         # Add new trHeight element
         tr_height = OxmlElement("w:trHeight")
-        tr_height.set(qn("w:val"), str(height_twips))
-        tr_height.set(qn("w:hRule"), "exact" if exact else "atLeast")
+        tr_height.set(_W_VAL, str(height_twips))
+        tr_height.set(_W_HRULE, "exact" if exact else "atLeast")
         tr_pr.append(tr_height)
 
     def _add_hyperlink(self, paragraph, span: TextSpan, is_header: bool = False) -> None:
@@ -338,7 +369,7 @@ class TableBuilder:
 
         # Create the hyperlink element
         hyperlink = OxmlElement("w:hyperlink")
-        hyperlink.set(qn("r:id"), r_id)
+        hyperlink.set(_R_ID, r_id)
 
         # Create the run element inside the hyperlink
         new_run = OxmlElement("w:r")
@@ -358,22 +389,22 @@ class TableBuilder:
 
         # Underline (standard for hyperlinks)
         underline = OxmlElement("w:u")
-        underline.set(qn("w:val"), "single")
+        underline.set(_W_VAL, "single")
         rPr.append(underline)
 
         # Blue color (standard for hyperlinks)
         color = OxmlElement("w:color")
-        color.set(qn("w:val"), "0563C1")
+        color.set(_W_VAL, "0563C1")
         rPr.append(color)
 
         # Code formatting
         if span.code:
             font = OxmlElement("w:rFonts")
-            font.set(qn("w:ascii"), "Consolas")
-            font.set(qn("w:hAnsi"), "Consolas")
+            font.set(_W_ASCII, "Consolas")
+            font.set(_W_HANSI, "Consolas")
             rPr.append(font)
             size = OxmlElement("w:sz")
-            size.set(qn("w:val"), "20")  # 10pt = 20 half-points
+            size.set(_W_VAL, "20")  # 10pt = 20 half-points
             rPr.append(size)
 
         # Strikethrough
@@ -79,8 +79,9 @@ class Converter:
         if all_variables and "{{" in markdown:
             markdown = self._template_engine.render_jinja_string(markdown, all_variables)
 
-        # Parse markdown to AST
-        elements = self._parser.parse(markdown)
+        # Parse markdown to AST lazily; the builder consumes elements as
+        # they are produced
+        elements = self._parser.iter_elements(markdown)
 
         # Determine template path
         template_path = self._get_template_path()
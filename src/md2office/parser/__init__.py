@@ -15,6 +15,8 @@ from md2office.parser.elements import (
     DocxTableCell,
     DocxTableRow,
     TextSpan,
+    decode_document,
+    encode_document,
 )
 from md2office.parser.markdown_parser import MarkdownParser
 from md2office.parser.renderer import DocxRenderer
@@ -36,4 +38,6 @@ __all__ = [
     "DocxHorizontalRule",
     "DocxAdmonition",
     "TextSpan",
+    "encode_document",
+    "decode_document",
 ]
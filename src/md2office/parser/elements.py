@@ -169,6 +169,12 @@ All elements are frozen (`frozen=True`), providing:
 - **Hashability**: Can be used as dict keys or in sets
 - **Performance**: msgspec optimizes frozen structs with __slots__
 
+Structs are also declared with `gc=False`. The AST is built bottom-up from
+strings, numbers and lists of other structs, so it cannot contain reference
+cycles; opting out of garbage collector tracking keeps large documents (many
+thousands of spans) from inflating cycle-collection passes. `array_like` is
+deliberately not used since it would change the JSON encoding of the AST.
+
 ### The Document Type
 
 The `Document` type alias (`Document = list[DocxElement]`) represents a complete
@@ -189,7 +195,7 @@ from typing import Literal
 import msgspec
 
 
-class TextSpan(msgspec.Struct, frozen=True):
+class TextSpan(msgspec.Struct, frozen=True, gc=False):
     """A span of text with inline formatting.
 
     TextSpan represents the smallest unit of formatted text in the AST. Multiple
@@ -283,7 +289,7 @@ class TextSpan(msgspec.Struct, frozen=True):
     link: str | None = None
 
 
-class DocxElement(msgspec.Struct, frozen=True, tag=True):
+class DocxElement(msgspec.Struct, frozen=True, gc=False, tag=True):
     """Base class for all block-level elements in the DOCX AST.
 
     DocxElement is the root of the element hierarchy representing block-level
@@ -362,9 +368,9 @@ class DocxElement(msgspec.Struct, frozen=True, tag=True):
         Serialization with msgspec:
             import msgspec
             elements = [DocxHeading(level=1, content=[...])]
-            json_bytes = msgspec.json.encode(elements)
-            decoded = msgspec.json.decode(json_bytes, type=list[DocxElement])
-            # msgspec automatically deserializes to correct subclass
+            json_bytes = encode_document(elements)
+            decoded = decode_document(json_bytes)
+            # msgspec deserializes each element to its tagged subclass
 
     Design Rationale:
         - msgspec over dataclasses: 10-100x faster serialization/deserialization
@@ -382,7 +388,7 @@ class DocxElement(msgspec.Struct, frozen=True, tag=True):
     pass
 
 
-class DocxHeading(DocxElement, frozen=True, tag="heading"):
+class DocxHeading(DocxElement, frozen=True, gc=False, tag="heading"):
     """Heading element (H1-H6) with automatic anchor generation for internal linking.
 
     DocxHeading represents Markdown headings (# through ######) in the AST. Each heading
@@ -402,7 +408,7 @@ class DocxHeading(DocxElement, frozen=True, tag="heading"):
             title" would have 3 spans). Empty content is technically valid but
             uncommon in practice.
         anchor: URL-safe bookmark anchor automatically generated from the heading
-            text by DocxRenderer._generate_anchor(). This field is ALWAYS populated
+            text by generate_anchor(). This field is ALWAYS populated
             for every heading during parsing - it is never None in practice, though
             the type signature allows None for backwards compatibility. The anchor
             follows GitHub-style slug generation rules: lowercase, spaces to hyphens,
@@ -426,7 +432,7 @@ class DocxHeading(DocxElement, frozen=True, tag="heading"):
             "Café & Restaurant" → "cafe--restaurant"
 
         The anchor generation happens in DocxRenderer.heading() method, which calls
-        _generate_anchor() with the concatenated text from all content spans.
+        generate_anchor() with the concatenated text from all content spans.
 
     Internal Linking:
         The anchor field enables cross-references within the document via Word bookmarks:
@@ -522,7 +528,7 @@ class DocxHeading(DocxElement, frozen=True, tag="heading"):
 
     See Also:
         - DocxRenderer.heading(): Creates DocxHeading from Markdown tokens
-        - DocxRenderer._generate_anchor(): Generates GitHub-style anchor slugs
+        - markdown_parser.generate_anchor(): Generates GitHub-style anchor slugs
         - DocxBuilder._build_heading(): Builds Word heading with bookmark
         - DocxBuilder._add_bookmark_start/end(): Adds Word bookmark elements
         - TextSpan: Inline formatted text used in heading content
@@ -534,7 +540,7 @@ class DocxHeading(DocxElement, frozen=True, tag="heading"):
     anchor: str | None = None  # Bookmark anchor for internal links
 
 
-class DocxParagraph(DocxElement, frozen=True, tag="paragraph"):
+class DocxParagraph(DocxElement, frozen=True, gc=False, tag="paragraph"):
     """Paragraph block element with inline formatted text content.
 
     DocxParagraph represents standard text paragraphs in the Markdown AST, corresponding
@@ -654,7 +660,7 @@ class DocxParagraph(DocxElement, frozen=True, tag="paragraph"):
     content: list[TextSpan]
 
 
-class DocxCodeBlock(DocxElement, frozen=True, tag="code_block"):
+class DocxCodeBlock(DocxElement, frozen=True, gc=False, tag="code_block"):
     """Fenced or indented code block with optional syntax highlighting.
 
     DocxCodeBlock represents multi-line code blocks in Markdown, created either by
@@ -813,7 +819,7 @@ class DocxCodeBlock(DocxElement, frozen=True, tag="code_block"):
     language: str | None = None
 
 
-class DocxBlockquote(DocxElement, frozen=True, tag="blockquote"):
+class DocxBlockquote(DocxElement, frozen=True, gc=False, tag="blockquote"):
     """Blockquote element containing nested block-level elements.
 
     DocxBlockquote represents quoted text blocks in Markdown, created with leading
@@ -972,13 +978,13 @@ class DocxBlockquote(DocxElement, frozen=True, tag="blockquote"):
         - DocxRenderer.block_quote(): Creates DocxBlockquote or DocxAdmonition
         - DocxBuilder._build_blockquote(): Builds Word quote blocks with indentation
         - StyleMapper.get_quote_style(): Maps blockquote to Word style name
-        - ADMONITION_PATTERN: Regex for detecting admonition markers
+        - ADMONITION_TYPES: Recognized admonition marker types
     """
 
-    children: list[DocxElement]
+    children: list[BlockElement]
 
 
-class DocxListItem(msgspec.Struct, frozen=True):
+class DocxListItem(msgspec.Struct, frozen=True, gc=False):
     """Individual list item with content and optional nested elements.
 
     DocxListItem represents a single item within a DocxList (ordered or unordered).
@@ -1005,10 +1011,13 @@ class DocxListItem(msgspec.Struct, frozen=True):
             - With link: [TextSpan(text="See "), TextSpan(text="docs", link="url")]
             - Empty: [] (valid but rare, renders as blank list item)
 
-        children: List of nested DocxElement blocks that appear after the primary
+        children: Tuple of nested DocxElement blocks that appear after the primary
             content, indented under this list item. Enables complex nested structures
             like multi-paragraph list items, sublists, code blocks within items, etc.
-            Defaults to empty list via msgspec.field(default_factory=list).
+            Defaults to an empty tuple, so the common childless item allocates
+            nothing. Struct equality compares field values as-is, so pass a
+            tuple: DocxListItem(content=[], children=[]) does not compare equal
+            to DocxListItem(content=[]).
 
             Common nested elements:
             - DocxList: Nested sublists (ordered or unordered) for hierarchical structure
@@ -1022,7 +1031,7 @@ class DocxListItem(msgspec.Struct, frozen=True):
             - Children are rendered indented beneath the item's primary content
             - Each child element is built recursively by DocxBuilder
             - Nested DocxList items are rendered with increased indentation level
-            - Empty children list (default): Simple list item with only content text
+            - Empty children tuple (default): Simple list item with only content text
             - Non-empty children: Complex list item with nested blocks
 
     List Item Structure:
@@ -1031,7 +1040,7 @@ class DocxListItem(msgspec.Struct, frozen=True):
         Simple (no children):
             - Item text
             content=[TextSpan(text="Item text")]
-            children=[]
+            children=()
 
         Complex (with nested elements):
             - Item text
@@ -1044,11 +1053,11 @@ class DocxListItem(msgspec.Struct, frozen=True):
 
               - Nested item
             content=[TextSpan(text="Item text")]
-            children=[
+            children=(
                 DocxParagraph(content=[...]),
                 DocxCodeBlock(code="code block", language=None),
                 DocxList(ordered=False, items=[...]),
-            ]
+            )
 
         The parser automatically handles blank lines and indentation to determine
         which elements are nested children vs. separate top-level elements.
@@ -1065,17 +1074,17 @@ class DocxListItem(msgspec.Struct, frozen=True):
 
         AST:
             DocxList(ordered=True, items=[
-                DocxListItem(content=[TextSpan(text="First item")], children=[]),
+                DocxListItem(content=[TextSpan(text="First item")], children=()),
                 DocxListItem(
                     content=[TextSpan(text="Second item")],
-                    children=[
+                    children=(
                         DocxList(ordered=False, items=[
                             DocxListItem(content=[TextSpan(text="Nested bullet")]),
                             DocxListItem(content=[TextSpan(text="Another nested bullet")]),
-                        ])
-                    ]
+                        ]),
+                    )
                 ),
-                DocxListItem(content=[TextSpan(text="Third item")], children=[]),
+                DocxListItem(content=[TextSpan(text="Third item")], children=()),
             ])
 
         When building Word documents, ListBuilder.build() recursively processes
@@ -1093,18 +1102,18 @@ class DocxListItem(msgspec.Struct, frozen=True):
         Example rendering:
             Simple item:
                 content=[TextSpan(text="Item")]
-                children=[]
+                children=()
                 → "- Item" (unordered) or "1. Item" (ordered)
 
             Item with nested list:
                 content=[TextSpan(text="Parent")]
-                children=[DocxList(ordered=False, items=[...])]
+                children=(DocxList(ordered=False, items=[...]),)
                 → "1. Parent"
                   "    - Nested child"
 
     Edge Cases:
         - Empty content (content=[]): Valid, renders as bullet/number with no text
-        - Empty children (children=[]): Default, simple list item with just content
+        - Empty children (children=()): Default, simple list item with just content
         - Both empty: Valid but renders as blank list item (rare)
         - Very deep nesting: No hard limit, but readability degrades beyond 3-4 levels
         - Mixed children types: All valid, each rendered appropriately
@@ -1115,7 +1124,7 @@ class DocxListItem(msgspec.Struct, frozen=True):
         Simple list item:
             DocxListItem(
                 content=[TextSpan(text="Simple item")],
-                children=[]
+                children=()
             )
 
         Formatted list item (Markdown: - This is **bold** text):
@@ -1125,33 +1134,33 @@ class DocxListItem(msgspec.Struct, frozen=True):
                     TextSpan(text="bold", bold=True),
                     TextSpan(text=" text"),
                 ],
-                children=[]
+                children=()
             )
 
         List item with nested sublist:
             DocxListItem(
                 content=[TextSpan(text="Parent item")],
-                children=[
+                children=(
                     DocxList(ordered=False, items=[
                         DocxListItem(content=[TextSpan(text="Nested 1")]),
                         DocxListItem(content=[TextSpan(text="Nested 2")]),
-                    ])
-                ]
+                    ]),
+                )
             )
 
         List item with multiple nested elements:
             DocxListItem(
                 content=[TextSpan(text="Main point")],
-                children=[
+                children=(
                     DocxParagraph(content=[TextSpan(text="Explanation paragraph")]),
                     DocxCodeBlock(code="example code", language="python"),
-                ]
+                )
             )
 
         Empty list item:
             DocxListItem(
                 content=[],
-                children=[]
+                children=()
             )
 
     Usage:
@@ -1179,10 +1188,10 @@ class DocxListItem(msgspec.Struct, frozen=True):
     """
 
     content: list[TextSpan]
-    children: list[DocxElement] = msgspec.field(default_factory=list)
+    children: tuple[BlockElement, ...] = ()
 
 
-class DocxList(DocxElement, frozen=True, tag="list"):
+class DocxList(DocxElement, frozen=True, gc=False, tag="list"):
     """Ordered (numbered) or unordered (bulleted) list with optional start number.
 
     DocxList represents both ordered and unordered lists in the Markdown AST. It
@@ -1291,21 +1300,21 @@ class DocxList(DocxElement, frozen=True, tag="list"):
                 DocxListItem(content=[TextSpan(text="First item")]),
                 DocxListItem(
                     content=[TextSpan(text="Second item")],
-                    children=[
+                    children=(
                         DocxList(ordered=False, items=[
                             DocxListItem(
                                 content=[TextSpan(text="Nested bullet")],
                             ),
                             DocxListItem(
                                 content=[TextSpan(text="Another bullet")],
-                                children=[
+                                children=(
                                     DocxList(ordered=True, start=1, items=[
                                         DocxListItem(content=[TextSpan(text="Deeply nested")]),
-                                    ])
-                                ]
+                                    ]),
+                                )
                             ),
-                        ])
-                    ]
+                        ]),
+                    )
                 ),
                 DocxListItem(content=[TextSpan(text="Third item")]),
             ])
@@ -1340,9 +1349,9 @@ class DocxList(DocxElement, frozen=True, tag="list"):
 
             Nested list:
                 ordered=True, items=[
-                    Item("Parent", children=[
-                        DocxList(ordered=False, items=[Item("Child")])
-                    ])
+                    Item("Parent", children=(
+                        DocxList(ordered=False, items=[Item("Child")]),
+                    ))
                 ]
                 → "1. Parent"
                   "    - Child"
@@ -1395,14 +1404,14 @@ class DocxList(DocxElement, frozen=True, tag="list"):
                 items=[
                     DocxListItem(
                         content=[TextSpan(text="Parent")],
-                        children=[
+                        children=(
                             DocxList(
                                 ordered=False,
                                 items=[
                                     DocxListItem(content=[TextSpan(text="Child")]),
                                 ]
-                            )
-                        ]
+                            ),
+                        )
                     )
                 ],
                 start=1
@@ -1462,7 +1471,7 @@ class DocxList(DocxElement, frozen=True, tag="list"):
     start: int = 1
 
 
-class DocxTableCell(msgspec.Struct, frozen=True):
+class DocxTableCell(msgspec.Struct, frozen=True, gc=False):
     """Table cell with content and merge directives.
 
     DocxTableCell represents a single cell in a Markdown table, including its text
@@ -1678,7 +1687,7 @@ class DocxTableCell(msgspec.Struct, frozen=True):
     merge_left: bool = False
 
 
-class DocxTableRow(msgspec.Struct, frozen=True):
+class DocxTableRow(msgspec.Struct, frozen=True, gc=False):
     """Single row in a table containing an ordered sequence of cells.
 
     DocxTableRow represents one horizontal row within a DocxTable. It is a simple
@@ -1712,6 +1721,20 @@ class DocxTableRow(msgspec.Struct, frozen=True):
                 num_cols = max(3, 2) = 3
                 Word table: Row 2 gets empty third cell automatically
 
+        vmerge_mask: Bitmask of cells in this row carrying the vertical merge
+            marker (^^). Bit i is set when cells[i].merge_up is True. Defaults
+            to 0 (no vertical merges).
+
+        hmerge_mask: Bitmask of cells in this row carrying the horizontal merge
+            marker (>>). Bit i is set when cells[i].merge_left is True. Defaults
+            to 0 (no horizontal merges).
+
+            The masks let TableBuilder._process_cell_merges() visit only the
+            columns that actually merge instead of reading two boolean flags
+            on every cell. Rows built by hand that only set the per-cell flags
+            are still supported: the builder derives the masks from the cells
+            when both are 0.
+
     Relationship to Table Structure:
         DocxTable contains rows, rows contain cells:
             DocxTable
@@ -1833,9 +1856,11 @@ class DocxTableRow(msgspec.Struct, frozen=True):
     """
 
     cells: list[DocxTableCell]
+    vmerge_mask: int = 0
+    hmerge_mask: int = 0
 
 
-class DocxTable(DocxElement, frozen=True, tag="table"):
+class DocxTable(DocxElement, frozen=True, gc=False, tag="table"):
     """Table block element with rows, cells, and optional header row.
 
     DocxTable represents Markdown tables in the AST, including both simple and complex
@@ -2129,7 +2154,7 @@ class DocxTable(DocxElement, frozen=True, tag="table"):
     has_header: bool = True
 
 
-class DocxImage(DocxElement, frozen=True, tag="image"):
+class DocxImage(DocxElement, frozen=True, gc=False, tag="image"):
     """Image element with source URL, alternative text, and optional title.
 
     DocxImage represents embedded images from Markdown image syntax (![alt](url "title")).
@@ -2269,7 +2294,7 @@ class DocxImage(DocxElement, frozen=True, tag="image"):
     title: str | None = None
 
 
-class DocxHorizontalRule(DocxElement, frozen=True, tag="hr"):
+class DocxHorizontalRule(DocxElement, frozen=True, gc=False, tag="hr"):
     """Horizontal rule element representing a thematic break or section divider.
 
     DocxHorizontalRule represents Markdown horizontal rules (also called thematic
@@ -2426,7 +2451,7 @@ class DocxHorizontalRule(DocxElement, frozen=True, tag="hr"):
 AdmonitionType = Literal["NOTE", "TIP", "IMPORTANT", "WARNING", "CAUTION"]
 
 
-class DocxAdmonition(DocxElement, frozen=True, tag="admonition"):
+class DocxAdmonition(DocxElement, frozen=True, gc=False, tag="admonition"):
     """Admonition/callout block for highlighted notes, warnings, and tips.
 
     DocxAdmonition represents GitHub-style admonition/callout blocks that highlight
@@ -2492,10 +2517,12 @@ class DocxAdmonition(DocxElement, frozen=True, tag="admonition"):
             type as a default title (e.g., showing "Note:" or "Warning:"), but this
             behavior is controlled by AdmonitionBuilder, not the AST element itself.
 
-        children: List of block-level elements contained within the admonition.
+        children: Tuple of block-level elements contained within the admonition.
             Can include paragraphs, lists, code blocks, or other block elements.
-            The children list is never None but can be empty (though empty admonitions
-            are rare and may indicate malformed Markdown).
+            The children tuple is never None but can be empty (though empty admonitions
+            are rare and may indicate malformed Markdown). Pass a tuple, not a
+            list: equality compares field values as-is, so an admonition built
+            with children=[] is not equal to one built with the default ().
 
             Typical patterns:
             - Single paragraph: Most common, simple note with one sentence
@@ -2607,11 +2634,11 @@ class DocxAdmonition(DocxElement, frozen=True, tag="admonition"):
                 DocxAdmonition(
                     admonition_type="NOTE",
                     title=None,
-                    children=[
+                    children=(
                         DocxParagraph(content=[
                             TextSpan(text="Remember to save your work frequently.")
-                        ])
-                    ]
+                        ]),
+                    )
                 )
 
         Warning with custom title:
@@ -2623,11 +2650,11 @@ class DocxAdmonition(DocxElement, frozen=True, tag="admonition"):
                 DocxAdmonition(
                     admonition_type="WARNING",
                     title="Breaking Change",
-                    children=[
+                    children=(
                         DocxParagraph(content=[
                             TextSpan(text="Version 2.0 removes deprecated APIs.")
-                        ])
-                    ]
+                        ]),
+                    )
                 )
 
         Multi-paragraph tip:
@@ -2641,14 +2668,14 @@ class DocxAdmonition(DocxElement, frozen=True, tag="admonition"):
                 DocxAdmonition(
                     admonition_type="TIP",
                     title=None,
-                    children=[
+                    children=(
                         DocxParagraph(content=[
                             TextSpan(text="Use keyboard shortcuts to work faster.")
                         ]),
                         DocxParagraph(content=[
                             TextSpan(text="Press Ctrl+S to save, Ctrl+Z to undo.")
                         ])
-                    ]
+                    )
                 )
 
         Important note with list:
@@ -2662,7 +2689,7 @@ class DocxAdmonition(DocxElement, frozen=True, tag="admonition"):
                 DocxAdmonition(
                     admonition_type="IMPORTANT",
                     title="Prerequisites",
-                    children=[
+                    children=(
                         DocxList(
                             ordered=False,
                             items=[
@@ -2670,8 +2697,8 @@ class DocxAdmonition(DocxElement, frozen=True, tag="admonition"):
                                 DocxListItem(content=[...]),
                                 DocxListItem(content=[...]),
                             ]
-                        )
-                    ]
+                        ),
+                    )
                 )
 
     Usage:
@@ -2679,7 +2706,7 @@ class DocxAdmonition(DocxElement, frozen=True, tag="admonition"):
         parsing Markdown blockquotes that start with the `[!TYPE]` pattern. The
         renderer:
         1. Parses blockquote children to get list of elements
-        2. Checks if first paragraph starts with ADMONITION_PATTERN regex
+        2. Checks if first paragraph starts with a known `[!TYPE]` marker
         3. Extracts admonition type and optional title from the match
         4. Removes the `[!TYPE]` marker from content
         5. Returns DocxAdmonition with type, title, and children
@@ -2697,8 +2724,53 @@ class DocxAdmonition(DocxElement, frozen=True, tag="admonition"):
 
     admonition_type: AdmonitionType
     title: str | None = None
-    children: list[DocxElement] = msgspec.field(default_factory=list)
+    children: tuple[BlockElement, ...] = ()
 
 
 # Type alias for document content
 Document = list[DocxElement]
+
+# Union of the concrete block elements. msgspec cannot decode a tagged union
+# through its base class, so nested children and decode_document() use this.
+BlockElement = (
+    DocxHeading
+    | DocxParagraph
+    | DocxCodeBlock
+    | DocxBlockquote
+    | DocxList
+    | DocxTable
+    | DocxImage
+    | DocxHorizontalRule
+    | DocxAdmonition
+)
+
+# Reused JSON encoder/decoder for whole documents
+_document_encoder = msgspec.json.Encoder()
+_document_decoder = msgspec.json.Decoder(list[BlockElement])
+
+
+def encode_document(document: Document) -> bytes:
+    """Serialize a document to JSON.
+
+    Args:
+        document: List of DocxElement objects.
+
+    Returns:
+        JSON bytes; each element carries its "type" tag.
+    """
+    return _document_encoder.encode(document)
+
+
+def decode_document(data: bytes | str) -> list[BlockElement]:
+    """Deserialize a document produced by encode_document().
+
+    Args:
+        data: JSON bytes or string.
+
+    Returns:
+        List of DocxElement objects.
+
+    Raises:
+        msgspec.ValidationError: If the JSON does not describe a document.
+    """
+    return _document_decoder.decode(data)
@@ -3,11 +3,18 @@
 from __future__ import annotations
 
 import re
+import sys
+import threading
+import unicodedata
+from collections.abc import Callable, Iterator
+from functools import lru_cache
+from typing import Any, cast
 
 import mistune
 
 from md2office.core.exceptions import ParserError
 from md2office.parser.elements import (
+    BlockElement,
     Document,
     DocxAdmonition,
     DocxBlockquote,
@@ -24,10 +31,142 @@ from md2office.parser.elements import (
     TextSpan,
 )
 
-# Pattern for GitHub-style admonitions
-ADMONITION_PATTERN = re.compile(
-    r"^\[!(NOTE|TIP|IMPORTANT|WARNING|CAUTION)\]\s*(.*)$", re.IGNORECASE
-)
+# Heading anchor slugs: characters to drop, and runs to collapse into "-"
+_ANCHOR_STRIP_RE = re.compile(r"[^\w\s-]")
+_ANCHOR_SEP_RE = re.compile(r"[\s_]+")
+
+# GitHub-style admonition types: > [!NOTE], > [!WARNING], etc.
+ADMONITION_TYPES = frozenset(("NOTE", "TIP", "IMPORTANT", "WARNING", "CAUTION"))
+
+# Admonition detection only looks at this many leading characters of the
+# first paragraph ("[!IMPORTANT]" is 12)
+_ADMONITION_PREFIX_LEN = 32
+
+# Shared immutable spans for unformatted breaks (also used by DocxRenderer),
+# and the (never mutated) content of merge-marker table cells
+SOFTBREAK_SPAN = TextSpan(text=" ")
+LINEBREAK_SPAN = TextSpan(text="\n")
+# Texts of soft and hard break spans, which _merge_spans keeps separate
+_BREAK_TEXTS = frozenset((SOFTBREAK_SPAN.text, LINEBREAK_SPAN.text))
+_EMPTY_SPANS: list[TextSpan] = []
+
+# Table cell texts marking vertical (^^) and horizontal (>>) merges
+_MERGE_MARKERS = frozenset(("^^", ">>"))
+
+# Characters that can start or take part in Markdown syntax (including
+# entities, escapes and line structure); text without any of them is one
+# plain paragraph
+_MARKUP_CHARS = frozenset("#*_`[]>|-+=~!<&\\\n\r")
+
+
+def match_admonition(text: str) -> tuple[str, int] | None:
+    """Match a case-insensitive [!TYPE] admonition marker at the start of text.
+
+    Args:
+        text: Leading text of a blockquote's first paragraph.
+
+    Returns:
+        Tuple of (upper-cased admonition type, index just past the marker),
+        or None if text does not start with a known marker.
+    """
+    if not text.startswith("[!"):
+        return None
+    close = text.find("]", 2)
+    if close < 0:
+        return None
+    kind = text[2:close]
+    if kind not in ADMONITION_TYPES:
+        # Markers are usually upper case already; fold only if not
+        kind = kind.upper()
+        if kind not in ADMONITION_TYPES:
+            return None
+    return kind, close + 1
+
+
+def _merge_spans(spans: list[TextSpan]) -> list[TextSpan]:
+    """Coalesce adjacent spans with identical formatting into one span.
+
+    mistune can emit several consecutive text tokens for one run of text;
+    merging them keeps the AST small and gives the builder fewer runs. Line
+    breaks, formatted or not, stay separate spans: a span whose whole text
+    is a soft (" ") or hard ("\\n") break is never merged.
+    """
+    merged: list[TextSpan] = []
+    count = len(spans)
+    i = 0
+    while i < count:
+        span = spans[i]
+        j = i + 1
+        if span.text not in _BREAK_TEXTS:
+            # Extend the run while the next span has the same formatting
+            bold, italic, code = span.bold, span.italic, span.code
+            strike, link = span.strikethrough, span.link
+            while j < count:
+                nxt = spans[j]
+                if (
+                    nxt.bold != bold
+                    or nxt.italic != italic
+                    or nxt.code != code
+                    or nxt.strikethrough != strike
+                    or nxt.link != link
+                    or nxt.text in _BREAK_TEXTS
+                ):
+                    break
+                j += 1
+        if j - i > 1:
+            text = "".join([s.text for s in spans[i:j]])
+            span = TextSpan(
+                text, span.bold, span.italic, span.code, span.strikethrough, span.link
+            )
+        merged.append(span)
+        i = j
+    return merged
+
+
+@lru_cache(maxsize=8)
+def _create_markdown(plugins: tuple[str, ...]) -> mistune.Markdown:
+    """Create (once per plugin set) the mistune instance used for tokenizing.
+
+    mistune keeps all per-document state in the state object created by each
+    parse() call, so one instance is safely shared by all parsers.
+    """
+    return mistune.create_markdown(renderer="ast", plugins=list(plugins))
+
+
+def generate_anchor(text: str) -> str:
+    """Generate a URL-safe anchor slug from heading text.
+
+    Follows GitHub-style anchor generation:
+    - Convert to lowercase
+    - Replace spaces with hyphens
+    - Remove special characters except hyphens and underscores
+    - Remove accents from characters
+
+    Args:
+        text: Heading text.
+
+    Returns:
+        Anchor slug suitable for bookmarks.
+    """
+    # Normalize unicode and remove accents (ASCII text has none). The delete
+    # table only covers the distinct characters of this heading.
+    if not text.isascii():
+        text = unicodedata.normalize("NFD", text)
+        text = text.translate(
+            {ord(c): None for c in set(text) if unicodedata.category(c) == "Mn"}
+        )
+
+    # Convert to lowercase
+    slug = text.lower()
+
+    # Replace spaces and special chars with hyphens
+    slug = _ANCHOR_STRIP_RE.sub("", slug)
+    slug = _ANCHOR_SEP_RE.sub("-", slug)
+
+    # Remove leading/trailing hyphens
+    slug = slug.strip("-")
+
+    return slug or "heading"
 
 
 class MarkdownParser:
@@ -39,7 +178,7 @@ class MarkdownParser:
 
     def __init__(self) -> None:
         """Initialize the parser with mistune tokenizer."""
-        self._md = mistune.create_markdown(plugins=["strikethrough", "table"])
+        self._md = _create_markdown(("strikethrough", "table"))
 
     def parse(self, markdown_text: str) -> Document:
         """Parse Markdown text into a list of DOCX elements.
@@ -53,56 +192,67 @@ class MarkdownParser:
         Raises:
             ParserError: If parsing fails.
         """
+        return list(self.iter_elements(markdown_text))
+
+    def iter_elements(self, markdown_text: str) -> Iterator[DocxElement]:
+        """Parse Markdown text, yielding top-level DOCX elements one by one.
+
+        Each block token is released as soon as its element is produced, so a
+        consumer that builds while iterating never holds the full AST and the
+        full token list at the same time.
+
+        Args:
+            markdown_text: Markdown source text.
+
+        Yields:
+            DocxElement objects in document order.
+
+        Raises:
+            ParserError: If parsing fails.
+        """
+        if not markdown_text:
+            return
+        if (
+            _MARKUP_CHARS.isdisjoint(markdown_text)
+            and not markdown_text[0].isdigit()
+            and markdown_text == markdown_text.strip()
+        ):
+            # Plain single-line text: what mistune would return, without it
+            yield DocxParagraph(content=[TextSpan(markdown_text)])
+            return
+
         try:
-            # Parse block tokens
-            state = self._md.block.state_cls()
-            state.process(markdown_text)
-            self._md.block.parse(state)
-
-            # Render to populate inline children (modifies tokens in place)
-            state.cursor = 0
-            state.cursor_max = len(state.tokens)
-            self._md.render_state(state)
-
-            # Now process the tokens with children populated
-            return self._process_tokens(state.tokens)
+            # The AST renderer returns block tokens with inline children
+            # populated, in a single tokenizing pass
+            result, _ = self._md.parse(markdown_text)
         except Exception as e:
             raise ParserError(f"Failed to parse Markdown: {e}") from e
 
-    def _process_tokens(self, tokens: list[dict]) -> list[DocxElement]:
+        # Pop tokens off the end of the reversed list, releasing each one
+        tokens = cast("list[dict[str, Any]]", result)
+        tokens.reverse()
+        get_handler = _BLOCK_HANDLERS.get
+        while tokens:
+            token = tokens.pop()
+            handler = get_handler(token["type"])
+            if handler is None:
+                continue
+            try:
+                element = handler(self, token)
+            except Exception as e:
+                raise ParserError(f"Failed to parse Markdown: {e}") from e
+            yield element
+
+    def _process_tokens(self, tokens: list[dict]) -> list[BlockElement]:
         """Process a list of tokens into DocxElements."""
-        elements: list[DocxElement] = []
-        for token in tokens:
-            element = self._process_token(token)
-            if element is not None:
-                elements.append(element)
-        return elements
-
-    def _process_token(self, token: dict) -> DocxElement | None:
-        """Process a single token into a DocxElement."""
-        token_type = token.get("type", "")
-
-        if token_type == "heading":
-            return self._process_heading(token)
-        elif token_type == "paragraph":
-            return self._process_paragraph(token)
-        elif token_type == "block_text":
-            # block_text is used inside list items, treat like paragraph
-            return self._process_paragraph(token)
-        elif token_type == "block_code":
-            return self._process_code_block(token)
-        elif token_type == "block_quote":
-            return self._process_blockquote(token)
-        elif token_type == "list":
-            return self._process_list(token)
-        elif token_type == "table":
-            return self._process_table(token)
-        elif token_type == "thematic_break":
-            return DocxHorizontalRule()
-        elif token_type == "blank_line":
-            return None
-        else:
-            return None
+        # Every handler returns an element; blank_line and unsupported block
+        # types have no handler and are dropped
+        handlers = _BLOCK_HANDLERS
+        return [
+            handler(self, token)
+            for token in tokens
+            if (handler := handlers.get(token["type"])) is not None
+        ]
 
     def _process_heading(self, token: dict) -> DocxHeading:
         """Process a heading token."""
@@ -113,7 +263,7 @@ class MarkdownParser:
 
         # Generate anchor slug from heading text for internal links
         text = "".join(span.text for span in content)
-        anchor = self._generate_anchor(text)
+        anchor = generate_anchor(text)
 
         return DocxHeading(level=level, content=content, anchor=anchor)
 
@@ -123,6 +273,10 @@ class MarkdownParser:
         content = self._process_inline_tokens(children)
         return DocxParagraph(content=content)
 
+    def _process_thematic_break(self, _token: dict) -> DocxHorizontalRule:
+        """Process a thematic break token."""
+        return DocxHorizontalRule()
+
     def _process_code_block(self, token: dict) -> DocxCodeBlock:
         """Process a code block token."""
         code = token.get("raw", "")
@@ -131,64 +285,75 @@ class MarkdownParser:
         language = info.split()[0] if info else None
         return DocxCodeBlock(code=code.rstrip("\n"), language=language)
 
-    def _process_blockquote(self, token: dict) -> DocxElement:
+    def _process_blockquote(self, token: dict) -> DocxAdmonition | DocxBlockquote:
         """Process a blockquote token, detecting admonitions."""
         children = token.get("children", [])
         elements = self._process_tokens(children)
 
-        # Check for GitHub-style admonition
+        # Check for GitHub-style admonition. Reject cheaply unless the first
+        # paragraph starts with "[" (the marker may be split across spans).
         if elements and isinstance(elements[0], DocxParagraph):
-            first_para = elements[0]
-            if first_para.content:
-                # Concatenate all text spans to handle cases where [!NOTE] is split
-                # by mistune's link parser into separate tokens
-                full_text = "".join(span.text for span in first_para.content)
-                match = ADMONITION_PATTERN.match(full_text)
+            first_content = elements[0].content
+            if first_content and first_content[0].text.startswith("["):
+                # Only a short prefix is needed to recognize the marker
+                prefix = ""
+                for span in first_content:
+                    prefix += span.text
+                    if len(prefix) >= _ADMONITION_PREFIX_LEN:
+                        break
+                match = match_admonition(prefix)
                 if match:
-                    admonition_type = match.group(1).upper()
+                    admonition_type, marker_end_pos = match
                     # Text after [!NOTE] on the same line becomes content
-                    content_after_marker = match.group(2).strip()
-
-                    # Build the content: start with text after marker if any,
-                    # then add remaining elements
-                    if content_after_marker:
-                        # Preserve the original formatting from the first paragraph
-                        # by finding where the marker ends and keeping the rest
-                        marker_end_pos = len(f"[!{admonition_type}]")
-                        new_spans = []
-                        char_count = 0
-                        for span in first_para.content:
-                            span_start = char_count
-                            span_end = char_count + len(span.text)
-                            if span_end > marker_end_pos:
-                                # This span contains content after the marker
-                                start_in_span = max(0, marker_end_pos - span_start)
-                                remaining = span.text[start_in_span:].lstrip()
-                                if remaining:
-                                    new_spans.append(TextSpan(
-                                        text=remaining,
-                                        bold=span.bold,
-                                        italic=span.italic,
-                                        code=span.code,
-                                        strikethrough=span.strikethrough,
-                                        link=span.link,
-                                    ))
-                            char_count = span_end
-                        if new_spans:
-                            elements[0] = DocxParagraph(content=new_spans)
-                        else:
-                            elements = elements[1:]
+                    new_spans = self._strip_admonition_marker(
+                        first_content, marker_end_pos
+                    )
+                    if new_spans:
+                        elements[0] = DocxParagraph(content=new_spans)
                     else:
                         elements = elements[1:]
 
                     return DocxAdmonition(
                         admonition_type=admonition_type,  # type: ignore[arg-type]
                         title=None,
-                        children=elements,
+                        children=tuple(elements),
                     )
 
         return DocxBlockquote(children=elements)
 
+    def _strip_admonition_marker(
+        self, content: list[TextSpan], marker_end_pos: int
+    ) -> list[TextSpan]:
+        """Return the spans of a paragraph following its admonition marker.
+
+        Leading whitespace after the marker is dropped; the first span with
+        content is trimmed and the spans after it are reused unchanged.
+        """
+        # Find the span in which the marker ends
+        first = span_start = 0
+        while first < len(content):
+            span_end = span_start + len(content[first].text)
+            if span_end > marker_end_pos:
+                break
+            span_start = span_end
+            first += 1
+        else:
+            return []
+
+        # Skip whitespace between the marker and the first content
+        start_in_span = marker_end_pos - span_start
+        for idx in range(first, len(content)):
+            span = content[idx]
+            remaining = span.text[start_in_span:].lstrip()
+            start_in_span = 0
+            if remaining:
+                if remaining is not span.text:
+                    bold, italic, code = span.bold, span.italic, span.code
+                    strike, link = span.strikethrough, span.link
+                    span = TextSpan(remaining, bold, italic, code, strike, link)
+                return [span, *content[idx + 1 :]]
+        return []
+
     def _process_list(self, token: dict) -> DocxList:
         """Process a list token."""
         attrs = token.get("attrs", {})
@@ -196,11 +361,11 @@ class MarkdownParser:
         start = attrs.get("start", 1) or 1
         children = token.get("children", [])
 
-        items: list[DocxListItem] = []
-        for child in children:
-            if child.get("type") == "list_item":
-                item = self._process_list_item(child)
-                items.append(item)
+        items = [
+            self._process_list_item(child)
+            for child in children
+            if child["type"] == "list_item"
+        ]
 
         return DocxList(ordered=ordered, items=items, start=start)
 
@@ -209,16 +374,13 @@ class MarkdownParser:
         children = token.get("children", [])
         elements = self._process_tokens(children)
 
-        content: list[TextSpan] = []
-        nested: list[DocxElement] = []
-
-        for i, elem in enumerate(elements):
-            if i == 0 and isinstance(elem, DocxParagraph):
-                content = list(elem.content)
-            else:
-                nested.append(elem)
-
-        return DocxListItem(content=content, children=nested)
+        # The first paragraph's (frozen) span list becomes the item content
+        # as is; everything after it is nested
+        if elements and isinstance(elements[0], DocxParagraph):
+            return DocxListItem(
+                content=elements[0].content, children=tuple(elements[1:])
+            )
+        return DocxListItem(content=[], children=tuple(elements))
 
     def _process_table(self, token: dict) -> DocxTable:
         """Process a table token."""
@@ -249,170 +411,199 @@ class MarkdownParser:
         # (mistune's table_head has direct table_cell children, no table_row wrapper)
         if children and children[0].get("type") == "table_cell":
             # Direct cells - create a single row from them
-            cells: list[DocxTableCell] = []
-            for child in children:
-                if child.get("type") == "table_cell":
-                    cell = self._process_table_cell(child, is_header)
-                    cells.append(cell)
+            cells = self._process_table_cells(children, is_header)
             if cells:
-                rows.append(DocxTableRow(cells=cells))
+                rows.append(self._make_table_row(cells))
         else:
             # Wrapped in table_row
-            for child in children:
-                if child.get("type") == "table_row":
-                    row = self._process_table_row(child, is_header)
-                    rows.append(row)
+            rows = [
+                self._process_table_row(child, is_header)
+                for child in children
+                if child["type"] == "table_row"
+            ]
 
         return rows
 
     def _process_table_row(self, token: dict, is_header: bool) -> DocxTableRow:
         """Process a table row token."""
-        children = token.get("children", [])
-        cells: list[DocxTableCell] = []
-
-        for child in children:
-            if child.get("type") == "table_cell":
-                cell = self._process_table_cell(child, is_header)
-                cells.append(cell)
-
-        return DocxTableRow(cells=cells)
+        cells = self._process_table_cells(token.get("children", []), is_header)
+        return self._make_table_row(cells)
+
+    def _process_table_cells(
+        self, tokens: list[dict], is_header: bool
+    ) -> list[DocxTableCell]:
+        """Process the table_cell tokens of a row."""
+        process_cell = self._process_table_cell
+        return [
+            process_cell(token, is_header)
+            for token in tokens
+            if token["type"] == "table_cell"
+        ]
+
+    def _make_table_row(self, cells: list[DocxTableCell]) -> DocxTableRow:
+        """Wrap cells in a row, packing their merge markers into bitmasks."""
+        vmerge_mask = 0
+        hmerge_mask = 0
+        for col_idx, cell in enumerate(cells):
+            if cell.merge_up:
+                vmerge_mask |= 1 << col_idx
+            if cell.merge_left:
+                hmerge_mask |= 1 << col_idx
+        return DocxTableRow(
+            cells=cells, vmerge_mask=vmerge_mask, hmerge_mask=hmerge_mask
+        )
 
     def _process_table_cell(self, token: dict, is_header: bool) -> DocxTableCell:
         """Process a table cell token."""
         children = token.get("children", [])
-        content = self._process_inline_tokens(children)
-
-        # Check for merge markers
-        text = "".join(span.text for span in content).strip()
-
-        # Vertical merge marker (^^) - merge with cell above
-        if text == "^^":
-            return DocxTableCell(content=[], is_header=is_header, merge_up=True)
 
-        # Horizontal merge marker (>>) - merge with cell to the left
-        if text == ">>":
-            return DocxTableCell(content=[], is_header=is_header, merge_left=True)
+        # Merge markers are a cell holding a single plain text token; cells
+        # with any other shape never need their text joined and compared
+        if len(children) == 1 and children[0]["type"] == "text":
+            marker = children[0].get("raw", "").strip()
+            if marker in _MERGE_MARKERS:
+                # Vertical merge marker (^^) - merge with cell above
+                # Horizontal merge marker (>>) - merge with cell to the left
+                return DocxTableCell(
+                    content=_EMPTY_SPANS,
+                    is_header=is_header,
+                    merge_up=marker == "^^",
+                    merge_left=marker == ">>",
+                )
 
+        content = self._process_inline_tokens(children)
         return DocxTableCell(content=content, is_header=is_header)
 
     def _process_inline_tokens(self, tokens: list[dict]) -> list[TextSpan]:
         """Process inline tokens into TextSpans."""
         spans: list[TextSpan] = []
+        self._walk_inline(tokens, spans, False, False, False, None)
+        return _merge_spans(spans) if len(spans) > 1 else spans
+
+    def _walk_inline(
+        self,
+        tokens: list[dict],
+        out: list[TextSpan],
+        bold: bool,
+        italic: bool,
+        strike: bool,
+        link: str | None,
+    ) -> None:
+        """Append the TextSpans of inline tokens to out.
+
+        Formatting from enclosing emphasis/strong/strikethrough/link tokens is
+        carried down as arguments, so each span is built exactly once at its
+        leaf token instead of being rebuilt at every nesting level.
+        """
+        get_handler = _INLINE_HANDLERS.get
         for token in tokens:
-            result = self._process_inline_token(token)
-            if isinstance(result, list):
-                spans.extend(result)
-            elif result is not None:
-                spans.append(result)
-        return spans
-
-    def _process_inline_token(
-        self, token: dict
-    ) -> TextSpan | list[TextSpan] | None:
-        """Process a single inline token."""
-        token_type = token.get("type", "")
-
-        if token_type == "text":
-            return TextSpan(text=token.get("raw", ""))
-        elif token_type == "emphasis":
-            children = token.get("children", [])
-            spans = self._process_inline_tokens(children)
-            return [
-                TextSpan(
-                    text=s.text,
-                    bold=s.bold,
-                    italic=True,
-                    code=s.code,
-                    strikethrough=s.strikethrough,
-                    link=s.link,
-                )
-                for s in spans
-            ]
-        elif token_type == "strong":
-            children = token.get("children", [])
-            spans = self._process_inline_tokens(children)
-            return [
-                TextSpan(
-                    text=s.text,
-                    bold=True,
-                    italic=s.italic,
-                    code=s.code,
-                    strikethrough=s.strikethrough,
-                    link=s.link,
-                )
-                for s in spans
-            ]
-        elif token_type == "codespan":
-            return TextSpan(text=token.get("raw", ""), code=True)
-        elif token_type == "strikethrough":
-            children = token.get("children", [])
-            spans = self._process_inline_tokens(children)
-            return [
-                TextSpan(
-                    text=s.text,
-                    bold=s.bold,
-                    italic=s.italic,
-                    code=s.code,
-                    strikethrough=True,
-                    link=s.link,
-                )
-                for s in spans
-            ]
-        elif token_type == "link":
-            children = token.get("children", [])
-            spans = self._process_inline_tokens(children)
-            attrs = token.get("attrs", {})
-            url = attrs.get("url", "")
-            return [
-                TextSpan(
-                    text=s.text,
-                    bold=s.bold,
-                    italic=s.italic,
-                    code=s.code,
-                    strikethrough=s.strikethrough,
-                    link=url,
-                )
-                for s in spans
-            ]
-        elif token_type == "softbreak":
-            return TextSpan(text=" ")
-        elif token_type == "linebreak":
-            return TextSpan(text="\n")
+            handler = get_handler(token["type"])
+            if handler is not None:
+                handler(self, token, out, bold, italic, strike, link)
+
+    def _process_text(
+        self,
+        token: dict,
+        out: list[TextSpan],
+        bold: bool,
+        italic: bool,
+        strike: bool,
+        link: str | None,
+    ) -> None:
+        """Process a text token."""
+        out.append(TextSpan(token.get("raw", ""), bold, italic, False, strike, link))
+
+    def _process_codespan(
+        self,
+        token: dict,
+        out: list[TextSpan],
+        bold: bool,
+        italic: bool,
+        strike: bool,
+        link: str | None,
+    ) -> None:
+        """Process an inline code token."""
+        out.append(TextSpan(token.get("raw", ""), bold, italic, True, strike, link))
+
+    def _process_softbreak(
+        self,
+        _token: dict,
+        out: list[TextSpan],
+        bold: bool,
+        italic: bool,
+        strike: bool,
+        link: str | None,
+    ) -> None:
+        """Process a soft line break token."""
+        if bold or italic or strike or link:
+            out.append(TextSpan(" ", bold, italic, False, strike, link))
         else:
-            return None
-
-    def _generate_anchor(self, text: str) -> str:
-        """Generate a URL-safe anchor slug from heading text.
-
-        Follows GitHub-style anchor generation:
-        - Convert to lowercase
-        - Replace spaces with hyphens
-        - Remove special characters except hyphens and underscores
-        - Remove accents from characters
-
-        Args:
-            text: Heading text.
-
-        Returns:
-            Anchor slug suitable for bookmarks.
-        """
-        import unicodedata
-
-        # Normalize unicode and remove accents
-        normalized = unicodedata.normalize("NFD", text)
-        ascii_text = "".join(c for c in normalized if unicodedata.category(c) != "Mn")
-
-        # Convert to lowercase
-        slug = ascii_text.lower()
-
-        # Replace spaces and special chars with hyphens
-        slug = re.sub(r"[^\w\s-]", "", slug)
-        slug = re.sub(r"[\s_]+", "-", slug)
-
-        # Remove leading/trailing hyphens
-        slug = slug.strip("-")
-
-        return slug or "heading"
+            out.append(SOFTBREAK_SPAN)
+
+    def _process_linebreak(
+        self,
+        _token: dict,
+        out: list[TextSpan],
+        bold: bool,
+        italic: bool,
+        strike: bool,
+        link: str | None,
+    ) -> None:
+        """Process a hard line break token."""
+        if bold or italic or strike or link:
+            out.append(TextSpan("\n", bold, italic, False, strike, link))
+        else:
+            out.append(LINEBREAK_SPAN)
+
+    def _process_emphasis(
+        self,
+        token: dict,
+        out: list[TextSpan],
+        bold: bool,
+        _italic: bool,
+        strike: bool,
+        link: str | None,
+    ) -> None:
+        """Process an emphasis (italic) token."""
+        self._walk_inline(token.get("children", []), out, bold, True, strike, link)
+
+    def _process_strong(
+        self,
+        token: dict,
+        out: list[TextSpan],
+        _bold: bool,
+        italic: bool,
+        strike: bool,
+        link: str | None,
+    ) -> None:
+        """Process a strong (bold) token."""
+        self._walk_inline(token.get("children", []), out, True, italic, strike, link)
+
+    def _process_strikethrough(
+        self,
+        token: dict,
+        out: list[TextSpan],
+        bold: bool,
+        italic: bool,
+        _strike: bool,
+        link: str | None,
+    ) -> None:
+        """Process a strikethrough token."""
+        self._walk_inline(token.get("children", []), out, bold, italic, True, link)
+
+    def _process_link(
+        self,
+        token: dict,
+        out: list[TextSpan],
+        bold: bool,
+        italic: bool,
+        strike: bool,
+        _link: str | None,
+    ) -> None:
+        """Process a link token."""
+        # Interned so spans of the same link share one string
+        url = sys.intern(token.get("attrs", {}).get("url", ""))
+        self._walk_inline(token.get("children", []), out, bold, italic, strike, url)
 
     def parse_file(self, filepath: str) -> Document:
         """Parse Markdown from a file.
@@ -434,14 +625,55 @@ class MarkdownParser:
             raise ParserError(f"Cannot read file: {e}") from e
 
 
+# Token type -> handler dispatch tables (unbound MarkdownParser methods).
+# Built after the class body so the module also compiles with mypyc.
+_BLOCK_HANDLERS: dict[str, Callable[..., BlockElement]] = {
+    "heading": MarkdownParser._process_heading,
+    "paragraph": MarkdownParser._process_paragraph,
+    # block_text is used inside list items, treat like paragraph
+    "block_text": MarkdownParser._process_paragraph,
+    "block_code": MarkdownParser._process_code_block,
+    "block_quote": MarkdownParser._process_blockquote,
+    "list": MarkdownParser._process_list,
+    "table": MarkdownParser._process_table,
+    "thematic_break": MarkdownParser._process_thematic_break,
+}
+
+_INLINE_HANDLERS: dict[str, Callable[..., None]] = {
+    "text": MarkdownParser._process_text,
+    "emphasis": MarkdownParser._process_emphasis,
+    "strong": MarkdownParser._process_strong,
+    "codespan": MarkdownParser._process_codespan,
+    "strikethrough": MarkdownParser._process_strikethrough,
+    "link": MarkdownParser._process_link,
+    "softbreak": MarkdownParser._process_softbreak,
+    "linebreak": MarkdownParser._process_linebreak,
+}
+
+
+# Shared parser for parse_markdown(), created on first use
+_default_parser: MarkdownParser | None = None
+_default_parser_lock = threading.Lock()
+
+
 def parse_markdown(text: str) -> Document:
     """Parse Markdown text into DOCX elements.
 
+    Reuses a single module-level MarkdownParser so repeated calls do not
+    rebuild the mistune parser and plugin chain.
+
     Args:
         text: Markdown source text.
 
     Returns:
         List of DocxElement objects.
     """
-    parser = MarkdownParser()
+    global _default_parser
+    parser = _default_parser
+    if parser is None:
+        with _default_parser_lock:
+            if _default_parser is None:
+                _default_parser = MarkdownParser()
+            parser = _default_parser
+    # MarkdownParser keeps no per-call state, so parses run concurrently
     return parser.parse(text)
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-import re
+from collections.abc import Callable
+from itertools import chain
 from typing import Any
 
 import mistune
@@ -23,27 +24,47 @@ from md2office.parser.elements import (
     DocxTableRow,
     TextSpan,
 )
-
-# Pattern for GitHub-style admonitions: > [!NOTE], > [!WARNING], etc.
-ADMONITION_PATTERN = re.compile(
-    r"^\[!(NOTE|TIP|IMPORTANT|WARNING|CAUTION)\]\s*(.*)$", re.IGNORECASE
+from md2office.parser.markdown_parser import (
+    LINEBREAK_SPAN,
+    SOFTBREAK_SPAN,
+    generate_anchor,
+    match_admonition,
 )
 
+# Default for tokens without attrs (shared, never mutated)
+_EMPTY_ATTRS: dict[str, Any] = {}
+
 
 class DocxRenderer(mistune.BaseRenderer):
-    """Custom renderer that produces DOCX AST elements instead of HTML."""
+    """Custom renderer that produces DOCX AST elements instead of HTML.
+
+    Render results are concrete element types and plain lists, never
+    subclasses, so they are checked with ``type(x) is`` rather than
+    isinstance; only the DocxElement base class needs isinstance.
+    """
 
     NAME = "docx"
 
     def __init__(self) -> None:
         super().__init__()
+        # Formatting of enclosing inline tokens, applied by the leaf handlers
+        self._bold = False
+        self._italic = False
+        self._strikethrough = False
+        self._link: str | None = None
+        # Render method per token type, resolved once via _get_method
+        self._method_cache: dict[str, Callable[..., Any]] = {}
 
     def _render_children(self, token: dict, state: Any) -> list:
         """Render children tokens."""
         children = token.get("children", [])
+        methods = self._method_cache
         result = []
         for child in children:
-            func = self._get_method(child["type"])
+            token_type = child["type"]
+            func = methods.get(token_type)
+            if func is None:
+                func = methods[token_type] = self._get_method(token_type)
             rendered = func(child, state)
             if rendered is not None:
                 result.append(rendered)
@@ -55,94 +76,49 @@ class DocxRenderer(mistune.BaseRenderer):
 
     def text(self, token: dict, state: Any) -> TextSpan:
         """Plain text."""
-        return TextSpan(text=token.get("raw", ""))
+        return self._span(token.get("raw", ""))
 
     def emphasis(self, token: dict, state: Any) -> list[TextSpan]:
         """Italic text (*text* or _text_)."""
-        children = self._render_children(token, state)
-        spans = self._flatten_inline(children)
-        return [
-            TextSpan(
-                text=span.text,
-                bold=span.bold,
-                italic=True,
-                code=span.code,
-                strikethrough=span.strikethrough,
-                link=span.link,
-            )
-            for span in spans
-        ]
+        return self._render_formatted(token, state, "_italic", True)
 
     def strong(self, token: dict, state: Any) -> list[TextSpan]:
         """Bold text (**text** or __text__)."""
-        children = self._render_children(token, state)
-        spans = self._flatten_inline(children)
-        return [
-            TextSpan(
-                text=span.text,
-                bold=True,
-                italic=span.italic,
-                code=span.code,
-                strikethrough=span.strikethrough,
-                link=span.link,
-            )
-            for span in spans
-        ]
+        return self._render_formatted(token, state, "_bold", True)
 
     def codespan(self, token: dict, state: Any) -> TextSpan:
         """Inline code (`code`)."""
-        return TextSpan(text=token.get("raw", ""), code=True)
+        return self._span(token.get("raw", ""), code=True)
 
     def strikethrough(self, token: dict, state: Any) -> list[TextSpan]:
         """Strikethrough text (~~text~~)."""
-        children = self._render_children(token, state)
-        spans = self._flatten_inline(children)
-        return [
-            TextSpan(
-                text=span.text,
-                bold=span.bold,
-                italic=span.italic,
-                code=span.code,
-                strikethrough=True,
-                link=span.link,
-            )
-            for span in spans
-        ]
+        return self._render_formatted(token, state, "_strikethrough", True)
 
     def link(self, token: dict, state: Any) -> list[TextSpan]:
         """Hyperlink [text](url)."""
-        children = self._render_children(token, state)
-        spans = self._flatten_inline(children)
-        attrs = token.get("attrs", {})
+        attrs = token.get("attrs") or _EMPTY_ATTRS
         url = attrs.get("url", "") or token.get("link", "")
-        return [
-            TextSpan(
-                text=span.text,
-                bold=span.bold,
-                italic=span.italic,
-                code=span.code,
-                strikethrough=span.strikethrough,
-                link=url,
-            )
-            for span in spans
-        ]
+        return self._render_formatted(token, state, "_link", url)
 
     def image(self, token: dict, state: Any) -> DocxImage:
         """Image ![alt](url)."""
-        attrs = token.get("attrs", {})
-        return DocxImage(
-            src=attrs.get("url", ""),
-            alt=token.get("alt", attrs.get("alt", "")),
-            title=attrs.get("title"),
-        )
+        attrs = token.get("attrs") or _EMPTY_ATTRS
+        alt = token.get("alt")
+        if alt is None:
+            # mistune 3 puts the alt text in the children as inline tokens
+            if token.get("children"):
+                alt = "".join(span.text for span in self._render_inline(token, state))
+            else:
+                alt = attrs.get("alt", "")
+        return DocxImage(src=attrs.get("url", ""), alt=alt, title=attrs.get("title"))
 
     def linebreak(self, token: dict, state: Any) -> TextSpan:
         """Hard line break."""
-        return TextSpan(text="\n")
+        return self._break_span(LINEBREAK_SPAN)
 
     def softbreak(self, token: dict, state: Any) -> TextSpan:
         """Soft line break."""
-        return TextSpan(text=" ")
+        return self._break_span(SOFTBREAK_SPAN)
 
     # -------------------------------------------------------------------------
     # Block elements - receive token dict and state
@@ -150,20 +126,18 @@ class DocxRenderer(mistune.BaseRenderer):
 
     def paragraph(self, token: dict, state: Any) -> DocxParagraph:
         """Paragraph block."""
-        children = self._render_children(token, state)
-        spans = self._flatten_inline(children)
+        spans = self._render_inline(token, state)
         return DocxParagraph(content=spans)
 
     def heading(self, token: dict, state: Any) -> DocxHeading:
         """Heading block (H1-H6)."""
-        children = self._render_children(token, state)
-        spans = self._flatten_inline(children)
-        attrs = token.get("attrs", {})
+        spans = self._render_inline(token, state)
+        attrs = token.get("attrs") or _EMPTY_ATTRS
         level = attrs.get("level", 1)
 
         # Generate anchor slug from heading text (like GitHub/Markdown does)
         text = "".join(span.text for span in spans)
-        anchor = self._generate_anchor(text)
+        anchor = generate_anchor(text)
 
         return DocxHeading(level=level, content=spans, anchor=anchor)
 
@@ -178,7 +152,7 @@ class DocxRenderer(mistune.BaseRenderer):
     def block_code(self, token: dict, state: Any) -> DocxCodeBlock:
         """Fenced or indented code block."""
         code = token.get("raw", "")
-        attrs = token.get("attrs", {})
+        attrs = token.get("attrs") or _EMPTY_ATTRS
         info = attrs.get("info", "") or token.get("info", "")
         language = info.split()[0] if info else None
         return DocxCodeBlock(code=code.rstrip("\n"), language=language)
@@ -189,30 +163,26 @@ class DocxRenderer(mistune.BaseRenderer):
         elements = self._flatten_blocks(children)
 
         # Check if this is an admonition (GitHub-style)
-        if elements and isinstance(elements[0], DocxParagraph):
+        if elements and type(elements[0]) is DocxParagraph:
             first_para = elements[0]
             if first_para.content:
                 first_text = first_para.content[0].text
-                match = ADMONITION_PATTERN.match(first_text)
+                match = match_admonition(first_text)
                 if match:
-                    admonition_type = match.group(1).upper()
-                    title_text = match.group(2).strip() or None
-
-                    # Update the first paragraph to remove the admonition marker
-                    remaining_text = first_text[match.end() :].strip()
-                    if remaining_text:
-                        new_first_span = TextSpan(text=remaining_text)
-                        new_content = [new_first_span] + list(first_para.content[1:])
-                        elements[0] = DocxParagraph(content=new_content)
-                    elif len(first_para.content) > 1:
-                        elements[0] = DocxParagraph(content=list(first_para.content[1:]))
+                    admonition_type, marker_end = match
+                    # Text after the marker in the same span is the title
+                    title_text = first_text[marker_end:].strip() or None
+
+                    # Drop the span holding the marker from the first paragraph
+                    if len(first_para.content) > 1:
+                        elements[0] = DocxParagraph(content=first_para.content[1:])
                     else:
-                        elements = elements[1:]
+                        del elements[0]
 
                     return DocxAdmonition(
                         admonition_type=admonition_type,  # type: ignore[arg-type]
                         title=title_text,
-                        children=elements,
+                        children=tuple(elements),
                     )
 
         return DocxBlockquote(children=elements)
@@ -220,11 +190,8 @@ class DocxRenderer(mistune.BaseRenderer):
     def list(self, token: dict, state: Any) -> DocxList:
         """Ordered or unordered list."""
         children = self._render_children(token, state)
-        items = []
-        for child in children:
-            if isinstance(child, DocxListItem):
-                items.append(child)
-        attrs = token.get("attrs", {})
+        items = [child for child in children if type(child) is DocxListItem]
+        attrs = token.get("attrs") or _EMPTY_ATTRS
         ordered = attrs.get("ordered", False)
         start = attrs.get("start", 1)
         return DocxList(ordered=ordered, items=items, start=start or 1)
@@ -233,17 +200,12 @@ class DocxRenderer(mistune.BaseRenderer):
         """List item."""
         children = self._render_children(token, state)
         # First paragraph becomes inline content, rest are nested elements
-        content: list[TextSpan] = []
-        nested: list[DocxElement] = []
-
         blocks = self._flatten_blocks(children)
-        for i, block in enumerate(blocks):
-            if i == 0 and isinstance(block, DocxParagraph):
-                content = list(block.content)
-            else:
-                nested.append(block)
-
-        return DocxListItem(content=content, children=nested)
+        if blocks and type(blocks[0]) is DocxParagraph:
+            return DocxListItem(
+                content=list(blocks[0].content), children=tuple(blocks[1:])
+            )
+        return DocxListItem(content=[], children=tuple(blocks))
 
     # -------------------------------------------------------------------------
     # Table elements
@@ -252,128 +214,155 @@ class DocxRenderer(mistune.BaseRenderer):
     def table(self, token: dict, state: Any) -> DocxTable:
         """Table block."""
         children = self._render_children(token, state)
-        rows: list[DocxTableRow] = []
-        has_header = False
-
-        for child in children:
-            if isinstance(child, list):
-                for row in child:
-                    if isinstance(row, DocxTableRow):
-                        if row.cells and row.cells[0].is_header:
-                            has_header = True
-                        rows.append(row)
-            elif isinstance(child, DocxTableRow):
-                if child.cells and child.cells[0].is_header:
-                    has_header = True
-                rows.append(child)
-
+        rows = [
+            row
+            for row in chain.from_iterable(
+                child if type(child) is list else (child,) for child in children
+            )
+            if type(row) is DocxTableRow
+        ]
+        # table_head comes first, so only the first row can be a header row
+        has_header = bool(rows and rows[0].cells and rows[0].cells[0].is_header)
         return DocxTable(rows=rows, has_header=has_header)
 
     def table_head(self, token: dict, state: Any) -> list[DocxTableRow]:
-        """Table header section."""
+        """Table header section.
+
+        mistune puts the header cells directly under table_head, already
+        flagged as header cells by table_cell.
+        """
         children = self._render_children(token, state)
-        return self._process_table_rows(children, is_header=True)
+        cells = [c for c in children if type(c) is DocxTableCell]
+        if not cells:
+            return []
+        if not cells[0].is_header:
+            # mistune versions that do not flag header cells
+            cells = [DocxTableCell(content=c.content, is_header=True) for c in cells]
+        return [DocxTableRow(cells=cells)]
 
     def table_body(self, token: dict, state: Any) -> list[DocxTableRow]:
         """Table body section."""
         children = self._render_children(token, state)
-        return self._process_table_rows(children, is_header=False)
+        return [c for c in children if type(c) is DocxTableRow]
 
     def table_row(self, token: dict, state: Any) -> DocxTableRow:
         """Table row."""
         children = self._render_children(token, state)
-        cells = [c for c in children if isinstance(c, DocxTableCell)]
+        cells = [c for c in children if type(c) is DocxTableCell]
         return DocxTableRow(cells=cells)
 
     def table_cell(self, token: dict, state: Any) -> DocxTableCell:
         """Table cell."""
-        children = self._render_children(token, state)
-        spans = self._flatten_inline(children)
-        attrs = token.get("attrs", {})
-        is_head = attrs.get("is_head", False)
+        spans = self._render_inline(token, state)
+        attrs = token.get("attrs") or _EMPTY_ATTRS
+        is_head = attrs.get("head", False)
         return DocxTableCell(content=spans, is_header=is_head)
 
     # -------------------------------------------------------------------------
     # Helper methods
     # -------------------------------------------------------------------------
 
-    def _flatten_inline(self, items: list[Any]) -> list[TextSpan]:
-        """Flatten nested inline elements into a list of TextSpans."""
-        result: list[TextSpan] = []
-        for item in items:
-            if isinstance(item, TextSpan):
-                result.append(item)
-            elif isinstance(item, list):
-                result.extend(self._flatten_inline(item))
-            elif isinstance(item, DocxImage):
-                # Images in inline context: add placeholder text
-                result.append(TextSpan(text=f"[Image: {item.alt or item.src}]"))
-            elif item is None:
-                pass
-            else:
-                # Convert other types to string
-                result.append(TextSpan(text=str(item)))
-        return result
+    def _span(self, text: str, code: bool = False) -> TextSpan:
+        """Create a leaf TextSpan carrying the enclosing inline formatting."""
+        return TextSpan(
+            text, self._bold, self._italic, code, self._strikethrough, self._link
+        )
 
-    def _flatten_blocks(self, items: list[Any]) -> list[DocxElement]:
-        """Flatten nested block elements into a list."""
-        result: list[DocxElement] = []
-        for item in items:
-            if isinstance(item, DocxElement):
-                result.append(item)
-            elif isinstance(item, list):
-                result.extend(self._flatten_blocks(item))
-            elif item is None:
-                pass
-        return result
+    def _render_inline(self, token: dict, state: Any) -> list[TextSpan]:
+        """Render the inline children of a block token into TextSpans.
 
-    def _process_table_rows(
-        self, children: list[Any], is_header: bool
-    ) -> list[DocxTableRow]:
-        """Process table rows from children."""
-        rows: list[DocxTableRow] = []
-        for child in children:
-            if isinstance(child, DocxTableRow):
-                # Update cells with header flag
-                if is_header:
-                    cells = [
-                        DocxTableCell(content=c.content, is_header=True)
-                        for c in child.cells
-                    ]
-                    rows.append(DocxTableRow(cells=cells))
-                else:
-                    rows.append(child)
-        return rows
-
-    def _generate_anchor(self, text: str) -> str:
-        """Generate a URL-safe anchor slug from heading text.
-
-        Follows GitHub-style anchor generation:
-        - Convert to lowercase
-        - Replace spaces with hyphens
-        - Remove special characters except hyphens and underscores
-        - Remove accents from characters
+        A single plain text child (most paragraphs and table cells) becomes
+        one unformatted span without going through dispatch and flattening.
+        """
+        children = token.get("children", ())
+        if len(children) == 1 and children[0]["type"] == "text":
+            return [TextSpan(children[0].get("raw", ""))]
+        return self._flatten_inline(self._render_children(token, state))
+
+    def _break_span(self, shared: TextSpan) -> TextSpan:
+        """Return the shared break span, or a formatted copy inside formatting."""
+        if self._bold or self._italic or self._strikethrough or self._link is not None:
+            return self._span(shared.text)
+        return shared
+
+    def _render_formatted(
+        self, token: dict, state: Any, attr: str, value: Any
+    ) -> list[TextSpan]:
+        """Render children of a formatting token with one formatting flag set.
+
+        The flag is set while the children render, so every span is created
+        once, already formatted, instead of being copied at each nesting level.
 
         Args:
-            text: Heading text.
+            token: emphasis/strong/strikethrough/link token.
+            state: mistune block state.
+            attr: Formatting attribute to set (e.g. "_italic").
+            value: Value for the attribute.
 
         Returns:
-            Anchor slug suitable for bookmarks.
+            Formatted child spans.
         """
-        import unicodedata
+        previous = getattr(self, attr)
+        setattr(self, attr, value)
+        try:
+            return self._flatten_inline(self._render_children(token, state))
+        finally:
+            setattr(self, attr, previous)
 
-        # Normalize unicode and remove accents
-        normalized = unicodedata.normalize("NFD", text)
-        ascii_text = "".join(c for c in normalized if unicodedata.category(c) != "Mn")
-
-        # Convert to lowercase
-        slug = ascii_text.lower()
+    def _flatten_inline(self, items: list[Any]) -> list[TextSpan]:
+        """Flatten nested inline elements into a list of TextSpans.
 
-        # Replace spaces and special chars with hyphens
-        slug = re.sub(r"[^\w\s-]", "", slug)
-        slug = re.sub(r"[\s_]+", "-", slug)
+        Walks the nesting depth-first with an explicit stack of iterators, like
+        _flatten_blocks.
+        """
+        for item in items:
+            if type(item) is not TextSpan:
+                break
+        else:
+            # Already flat (the common case): reuse the fresh children list
+            return items
+        result: list[TextSpan] = []
+        stack = [iter(items)]
+        while stack:
+            for item in stack[-1]:
+                item_type = type(item)
+                if item_type is TextSpan:
+                    result.append(item)
+                elif item_type is list:
+                    stack.append(iter(item))
+                    break
+                elif item_type is DocxImage:
+                    # Images in inline context: add placeholder text
+                    result.append(self._span(f"[Image: {item.alt or item.src}]"))
+                elif item is not None:
+                    # Convert other types to string
+                    result.append(self._span(str(item)))
+            else:
+                stack.pop()
+        return result
 
-        # Remove leading/trailing hyphens
-        slug = slug.strip("-")
+    def _flatten_blocks(self, items: list[Any]) -> list[DocxElement]:
+        """Flatten nested block elements into a list.
 
-        return slug or "heading"
+        Walks the nesting depth-first with an explicit stack of iterators, so
+        deeply nested results cannot hit the recursion limit.
+        """
+        for item in items:
+            if not isinstance(item, DocxElement):
+                break
+        else:
+            # Already flat: reuse the fresh children list
+            return items
+        result: list[DocxElement] = []
+        stack = [iter(items)]
+        while stack:
+            for item in stack[-1]:
+                if type(item) is list:
+                    # Descend; the current iterator resumes afterwards
+                    stack.append(iter(item))
+                    break
+                if isinstance(item, DocxElement):
+                    result.append(item)
+            else:
+                stack.pop()
+        return result
@@ -3,16 +3,36 @@
 from __future__ import annotations
 
 import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from docx import Document
-from docx.table import Table
+from docx.blkcntnr import BlockItemContainer
 from docx.text.paragraph import Paragraph
-from jinja2 import BaseLoader, Environment, TemplateSyntaxError
+from jinja2 import BaseLoader, Environment, Template, TemplateSyntaxError
 
 from md2office.core.exceptions import TemplateError
 from md2office.template.storage import TemplateStorage
 
+# Maximum number of compiled Jinja2 string templates kept per process, and
+# the longest source cached: converters render whole documents as templates,
+# which rarely repeat and would otherwise be kept for the process lifetime
+_TEMPLATE_CACHE_SIZE = 256
+_TEMPLATE_CACHE_MAX_SOURCE = 4096
+
+# Joins paragraph texts for a single scan. NUL cannot occur in XML text and
+# the lone "}" ends any variable name, so no match can span two paragraphs.
+_TEXT_SEPARATOR = "\x00}\x00"
+
+# Whether an element's text (any run split) contains a placeholder opening,
+# and the direct w:p children for which that holds
+_HAS_PLACEHOLDER_XPATH = 'contains(string(.), "{{")'
+_PLACEHOLDER_XPATH = f"./w:p[{_HAS_PLACEHOLDER_XPATH}]"
+# Cell paragraphs of direct tables, each merged cell visited once
+_CELL_PLACEHOLDER_XPATH = f"./w:tbl/w:tr/w:tc/w:p[{_HAS_PLACEHOLDER_XPATH}]"
+
 
 class StringLoader(BaseLoader):
     """Jinja2 loader for string templates."""
@@ -21,6 +41,50 @@ class StringLoader(BaseLoader):
         return template, None, lambda: True
 
 
+# Shared by all engines, since converters create an engine per conversion:
+# the Jinja2 environment (created on first use; {{var}} injection never needs
+# it) and the compiled templates by source string, least recently used first
+_jinja_env: Environment | None = None
+_template_cache: OrderedDict[str, Template] = OrderedDict()
+_template_cache_lock = threading.Lock()
+
+
+def _get_string_template(template_str: str) -> Template:
+    """Get the compiled template for a string, compiling it on first use.
+
+    Only sources up to _TEMPLATE_CACHE_MAX_SOURCE characters are cached.
+    Compilation runs outside the lock; concurrent first uses of one string
+    may each compile it, and the last one is kept.
+
+    Args:
+        template_str: Jinja2 template string.
+
+    Returns:
+        Compiled Jinja2 template.
+
+    Raises:
+        TemplateSyntaxError: If the template is invalid.
+    """
+    global _jinja_env
+    with _template_cache_lock:
+        template = _template_cache.get(template_str)
+        if template is not None:
+            _template_cache.move_to_end(template_str)
+            return template
+        if _jinja_env is None:
+            _jinja_env = Environment(loader=StringLoader())
+        env = _jinja_env
+
+    template = env.from_string(template_str)
+    if len(template_str) > _TEMPLATE_CACHE_MAX_SOURCE:
+        return template
+    with _template_cache_lock:
+        _template_cache[template_str] = template
+        if len(_template_cache) > _TEMPLATE_CACHE_SIZE:
+            _template_cache.popitem(last=False)
+    return template
+
+
 class TemplateEngine:
     """Handles DOCX template loading and variable injection.
 
@@ -30,8 +94,9 @@ class TemplateEngine:
     - Table cells
     """
 
-    # Pattern for finding {{variable}} placeholders
-    VARIABLE_PATTERN = re.compile(r"\{\{([^}]+)\}\}")
+    # Pattern for finding {{variable}} placeholders; the name is captured
+    # without surrounding whitespace
+    VARIABLE_PATTERN = re.compile(r"\{\{(?=[^}])\s*([^}]*?)\s*\}\}")
 
     def __init__(self, storage: TemplateStorage | None = None) -> None:
         """Initialize template engine.
@@ -40,7 +105,6 @@ class TemplateEngine:
             storage: Optional template storage instance.
         """
         self._storage = storage or TemplateStorage()
-        self._jinja_env = Environment(loader=StringLoader())
 
     def load_template(self, name: str) -> Document:
         """Load a template document.
@@ -77,43 +141,71 @@ class TemplateEngine:
         Returns:
             Modified document.
         """
-        # Process body paragraphs
-        for paragraph in document.paragraphs:
+        if not variables:
+            return document
+
+        # Convert values once instead of on every placeholder
+        variables = {name: str(value) for name, value in variables.items()}
+
+        for paragraph in self._iter_paragraphs(document):
             self._inject_in_paragraph(paragraph, variables)
 
-        # Process tables
-        for table in document.tables:
-            self._inject_in_table(table, variables)
+        return document
+
+    def _iter_paragraphs(self, document: Document) -> Iterator[Paragraph]:
+        """Iterate over the paragraphs that may hold placeholders.
+
+        Covers body paragraphs, table cells, and the paragraphs and tables of
+        each distinct header and footer. Paragraphs without "{{" are filtered
+        out in libxml2, before python-docx assembles their text.
+
+        Args:
+            document: Document to walk.
+
+        Yields:
+            Body, table, header and footer paragraphs containing "{{".
+        """
+        yield from self._placeholder_paragraphs(document._body)
 
-        # Process headers
+        # Sections linked to the previous one share its header/footer part;
+        # visit each part once
+        seen_parts: set[object] = set()
         for section in document.sections:
-            header = section.header
-            if header:
-                for paragraph in header.paragraphs:
-                    self._inject_in_paragraph(paragraph, variables)
-                for table in header.tables:
-                    self._inject_in_table(table, variables)
-
-            # Process footers
-            footer = section.footer
-            if footer:
-                for paragraph in footer.paragraphs:
-                    self._inject_in_paragraph(paragraph, variables)
-                for table in footer.tables:
-                    self._inject_in_table(table, variables)
+            for part in (section.header, section.footer):
+                if part and part.part not in seen_parts:
+                    seen_parts.add(part.part)
+                    yield from self._placeholder_paragraphs(part)
 
-        return document
+    def _placeholder_paragraphs(self, container: BlockItemContainer) -> list[Paragraph]:
+        """Get the paragraphs of a container whose text contains "{{".
+
+        Direct paragraphs come first, then the cell paragraphs of its direct
+        tables. Only the matching w:p elements get a Paragraph wrapper; no
+        Table, row or cell wrappers are built.
+
+        Args:
+            container: Document body, header or footer.
+
+        Returns:
+            Matching paragraphs, in document order within each group.
+        """
+        element = container._element
+        return [
+            Paragraph(p, container)
+            for xpath in (_PLACEHOLDER_XPATH, _CELL_PLACEHOLDER_XPATH)
+            for p in element.xpath(xpath)
+        ]
 
     def _inject_in_paragraph(
         self,
         paragraph: Paragraph,
-        variables: dict[str, Any],
+        variables: dict[str, str],
     ) -> None:
         """Inject variables into a paragraph.
 
         Args:
             paragraph: Paragraph to process.
-            variables: Variables dictionary.
+            variables: Variables dictionary with string values.
         """
         # Check if paragraph contains any variables
         full_text = paragraph.text
@@ -124,67 +216,35 @@ class TemplateEngine:
         new_text = self._replace_variables(full_text, variables)
 
         if new_text != full_text:
-            # Clear existing runs and add new text
-            # This preserves the first run's formatting
-            if paragraph.runs:
-                first_run = paragraph.runs[0]
-                # Store formatting
-                bold = first_run.bold
-                italic = first_run.italic
-                font_name = first_run.font.name
-                font_size = first_run.font.size
-
-                # Clear all runs
-                for run in paragraph.runs:
-                    run.text = ""
-
-                # Set new text on first run
-                first_run.text = new_text
-                first_run.bold = bold
-                first_run.italic = italic
-                if font_name:
-                    first_run.font.name = font_name
-                if font_size:
-                    first_run.font.size = font_size
-
-    def _inject_in_table(
-        self,
-        table: Table,
-        variables: dict[str, Any],
-    ) -> None:
-        """Inject variables into a table.
-
-        Args:
-            table: Table to process.
-            variables: Variables dictionary.
-        """
-        for row in table.rows:
-            for cell in row.cells:
-                for paragraph in cell.paragraphs:
-                    self._inject_in_paragraph(paragraph, variables)
+            # Put the new text in the first run and drop the other runs in one
+            # pass. Setting run.text only replaces the run's content, so the
+            # first run's formatting (w:rPr) is preserved as is.
+            runs = paragraph.runs
+            if runs:
+                p = paragraph._p
+                for run in runs[1:]:
+                    p.remove(run._r)
+                runs[0].text = new_text
 
     def _replace_variables(
         self,
         text: str,
-        variables: dict[str, Any],
+        variables: dict[str, str],
     ) -> str:
         """Replace variable placeholders in text.
 
         Args:
             text: Text containing {{variable}} placeholders.
-            variables: Dictionary of variable values.
+            variables: Dictionary of variable values, already converted to str.
 
         Returns:
             Text with variables replaced.
         """
-        def replace_match(match: re.Match) -> str:
-            var_name = match.group(1).strip()
-            if var_name in variables:
-                return str(variables[var_name])
-            # Leave unmatched variables as-is
-            return match.group(0)
-
-        return self.VARIABLE_PATTERN.sub(replace_match, text)
+        # Leave unmatched variables as-is; the lookup is bound as a default
+        # argument so each match does a local load instead of a closure lookup
+        return self.VARIABLE_PATTERN.sub(
+            lambda match, get=variables.get: get(match.group(1), match.group(0)), text
+        )
 
     def extract_variables(self, document: Document) -> set[str]:
         """Extract all variable names from a document.
@@ -195,29 +255,9 @@ class TemplateEngine:
         Returns:
             Set of variable names found.
         """
-        variables: set[str] = set()
-
-        # Scan body
-        for paragraph in document.paragraphs:
-            variables.update(self._extract_from_text(paragraph.text))
-
-        # Scan tables
-        for table in document.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    for paragraph in cell.paragraphs:
-                        variables.update(self._extract_from_text(paragraph.text))
-
-        # Scan headers and footers
-        for section in document.sections:
-            if section.header:
-                for paragraph in section.header.paragraphs:
-                    variables.update(self._extract_from_text(paragraph.text))
-            if section.footer:
-                for paragraph in section.footer.paragraphs:
-                    variables.update(self._extract_from_text(paragraph.text))
-
-        return variables
+        # One regex scan over all candidate texts instead of one per paragraph
+        texts = [paragraph.text for paragraph in self._iter_paragraphs(document)]
+        return self._extract_from_text(_TEXT_SEPARATOR.join(texts))
 
     def _extract_from_text(self, text: str) -> set[str]:
         """Extract variable names from text.
@@ -228,7 +268,7 @@ class TemplateEngine:
         Returns:
             Set of variable names found.
         """
-        return {match.group(1).strip() for match in self.VARIABLE_PATTERN.finditer(text)}
+        return set(self.VARIABLE_PATTERN.findall(text))
 
     def process_template(
         self,
@@ -267,9 +307,28 @@ class TemplateEngine:
             TemplateError: If rendering fails.
         """
         try:
-            template = self._jinja_env.from_string(template_str)
+            template = _get_string_template(template_str)
             return template.render(**variables)
         except TemplateSyntaxError as e:
             raise TemplateError(f"Template syntax error: {e}") from e
         except Exception as e:
             raise TemplateError(f"Template rendering failed: {e}") from e
+
+    def precompile(self, templates: Iterable[str]) -> None:
+        """Compile Jinja2 template strings ahead of rendering.
+
+        Warms the process-wide compiled-template cache, e.g. at service
+        startup, so the first render_jinja_string call for each string (from
+        any engine) skips compilation.
+
+        Args:
+            templates: Jinja2 template strings.
+
+        Raises:
+            TemplateError: If a template has a syntax error.
+        """
+        for template_str in templates:
+            try:
+                _get_string_template(template_str)
+            except TemplateSyntaxError as e:
+                raise TemplateError(f"Template syntax error: {e}") from e
@@ -2,18 +2,68 @@
 
 from __future__ import annotations
 
+import threading
+from collections.abc import Callable
+from copy import deepcopy
+from io import BytesIO
 from pathlib import Path
 
 from docx import Document
 from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.table import WD_TABLE_ALIGNMENT
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
-from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
+from docx.oxml import OxmlElement, parse_xml
+from docx.oxml.ns import nsdecls
 from docx.shared import Inches, Pt, RGBColor, Twips
 
 from md2office.utils.helpers import ensure_dir
 
+# Saved template bytes by template kind, filled on first creation
+_template_bytes: dict[str, bytes] = {}
+_template_bytes_lock = threading.Lock()
+
+# Heading configurations: (level, size, bold, color)
+_DEFAULT_HEADINGS = (
+    (1, 24, True, "2F5496"),
+    (2, 18, True, "2F5496"),
+    (3, 14, True, "2F5496"),
+    (4, 12, True, "2F5496"),
+    (5, 11, True, "2F5496"),
+    (6, 11, False, "2F5496"),
+)
+
+# Professional color scheme - dark blue gradient
+_PROFESSIONAL_HEADINGS = (
+    # (level, font_size, bold, color, space_before, space_after, font_name)
+    (1, 28, True, "1B4F72", 24, 12, "Calibri Light"),
+    (2, 22, True, "1F618D", 18, 10, "Calibri Light"),
+    (3, 16, True, "2874A6", 14, 8, "Calibri"),
+    (4, 13, True, "2E86C1", 12, 6, "Calibri"),
+    (5, 12, True, "3498DB", 10, 4, "Calibri"),
+    (6, 11, True, "5DADE2", 8, 4, "Calibri"),
+)
+
+# Prototype run holding a PAGE field (begin, instruction, separate, end);
+# each page number copies its children into a new run
+_PAGE_FIELD_RUN = parse_xml(
+    f"<w:r {nsdecls('w')}>"
+    '<w:fldChar w:fldCharType="begin"/>'
+    '<w:instrText xml:space="preserve">PAGE</w:instrText>'
+    '<w:fldChar w:fldCharType="separate"/>'
+    '<w:fldChar w:fldCharType="end"/>'
+    "</w:r>"
+)
+
+# Table borders all set to nil
+_NO_TABLE_BORDERS_XML = (
+    f"<w:tblBorders {nsdecls('w')}>"
+    + "".join(
+        f'<w:{name} w:val="nil"/>'
+        for name in ("top", "left", "bottom", "right", "insideH", "insideV")
+    )
+    + "</w:tblBorders>"
+)
+
 
 def create_default_template(output_path: Path | str | None = None) -> Path:
     """Create a default DOCX template with standard styles.
@@ -31,7 +81,13 @@ def create_default_template(output_path: Path | str | None = None) -> Path:
         output_path = Path(output_path)
 
     ensure_dir(output_path.parent)
+    output_path.write_bytes(_get_template_bytes("default", _build_default_template))
+
+    return output_path
 
+
+def _build_default_template() -> bytes:
+    """Build the default template and return its saved bytes."""
     doc = Document()
 
     # Configure document margins
@@ -59,32 +115,49 @@ def create_default_template(output_path: Path | str | None = None) -> Path:
     # Add footer with page number
     _configure_footer(doc)
 
-    # Save the template
-    doc.save(output_path)
+    return _save_bytes(doc)
+
+
+def _get_template_bytes(kind: str, build: Callable[[], bytes]) -> bytes:
+    """Get the saved bytes of a template kind, building them on first use.
+
+    The templates are fully determined by this module, so each kind is built
+    once per process; the lock keeps concurrent first calls from building twice.
+    """
+    with _template_bytes_lock:
+        data = _template_bytes.get(kind)
+        if data is None:
+            data = _template_bytes[kind] = build()
+        return data
 
-    return output_path
+
+def _save_bytes(doc: Document) -> bytes:
+    """Save a document to memory and return its bytes."""
+    buffer = BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def _get_or_add_style(styles, existing: dict, name: str, style_type: WD_STYLE_TYPE):
+    """Get a style from a name snapshot of styles, adding it if missing.
+
+    python-docx looks styles up by name with a linear scan of styles.xml, so
+    callers snapshot the names once instead of indexing styles repeatedly.
+    """
+    style = existing.get(name)
+    if style is None:
+        style = existing[name] = styles.add_style(name, style_type)
+    return style
 
 
 def _configure_heading_styles(doc: Document) -> None:
     """Configure heading styles."""
     styles = doc.styles
+    existing = {style.name: style for style in styles}
 
-    # Heading configurations: (level, size, bold, color)
-    heading_config = [
-        (1, 24, True, "2F5496"),
-        (2, 18, True, "2F5496"),
-        (3, 14, True, "2F5496"),
-        (4, 12, True, "2F5496"),
-        (5, 11, True, "2F5496"),
-        (6, 11, False, "2F5496"),
-    ]
-
-    for level, size, bold, color in heading_config:
+    for level, size, bold, color in _DEFAULT_HEADINGS:
         style_name = f"Heading {level}"
-        try:
-            style = styles[style_name]
-        except KeyError:
-            style = styles.add_style(style_name, WD_STYLE_TYPE.PARAGRAPH)
+        style = _get_or_add_style(styles, existing, style_name, WD_STYLE_TYPE.PARAGRAPH)
 
         style.font.size = Pt(size)
         style.font.bold = bold
@@ -96,21 +169,16 @@ def _configure_heading_styles(doc: Document) -> None:
 def _configure_code_styles(doc: Document) -> None:
     """Configure code styles."""
     styles = doc.styles
+    existing = {style.name: style for style in styles}
 
     # Inline code character style
-    try:
-        code_char = styles["Code Char"]
-    except KeyError:
-        code_char = styles.add_style("Code Char", WD_STYLE_TYPE.CHARACTER)
+    code_char = _get_or_add_style(styles, existing, "Code Char", WD_STYLE_TYPE.CHARACTER)
 
     code_char.font.name = "Consolas"
     code_char.font.size = Pt(10)
 
     # Code block paragraph style
-    try:
-        code_block = styles["Code Block"]
-    except KeyError:
-        code_block = styles.add_style("Code Block", WD_STYLE_TYPE.PARAGRAPH)
+    code_block = _get_or_add_style(styles, existing, "Code Block", WD_STYLE_TYPE.PARAGRAPH)
 
     code_block.font.name = "Consolas"
     code_block.font.size = Pt(10)
@@ -122,21 +190,16 @@ def _configure_code_styles(doc: Document) -> None:
 def _configure_list_styles(doc: Document) -> None:
     """Configure list styles."""
     styles = doc.styles
+    existing = {style.name: style for style in styles}
 
     # List Bullet style
-    try:
-        list_bullet = styles["List Bullet"]
-    except KeyError:
-        list_bullet = styles.add_style("List Bullet", WD_STYLE_TYPE.PARAGRAPH)
+    list_bullet = _get_or_add_style(styles, existing, "List Bullet", WD_STYLE_TYPE.PARAGRAPH)
 
     list_bullet.paragraph_format.left_indent = Inches(0.5)
     list_bullet.paragraph_format.space_after = Pt(3)
 
     # List Number style
-    try:
-        list_number = styles["List Number"]
-    except KeyError:
-        list_number = styles.add_style("List Number", WD_STYLE_TYPE.PARAGRAPH)
+    list_number = _get_or_add_style(styles, existing, "List Number", WD_STYLE_TYPE.PARAGRAPH)
 
     list_number.paragraph_format.left_indent = Inches(0.5)
     list_number.paragraph_format.space_after = Pt(3)
@@ -145,11 +208,9 @@ def _configure_list_styles(doc: Document) -> None:
 def _configure_quote_style(doc: Document) -> None:
     """Configure blockquote style."""
     styles = doc.styles
+    existing = {style.name: style for style in styles}
 
-    try:
-        quote = styles["Quote"]
-    except KeyError:
-        quote = styles.add_style("Quote", WD_STYLE_TYPE.PARAGRAPH)
+    quote = _get_or_add_style(styles, existing, "Quote", WD_STYLE_TYPE.PARAGRAPH)
 
     quote.font.italic = True
     quote.font.color.rgb = RGBColor.from_string("666666")
@@ -179,29 +240,20 @@ def _configure_footer(doc: Document) -> None:
     _add_page_number_field(paragraph)
 
 
-def _add_page_number_field(paragraph) -> None:
-    """Add a page number field to a paragraph."""
-    from docx.oxml import OxmlElement
-    from docx.oxml.ns import qn
+def _add_page_number_field(paragraph, color: str | None = None, size: float | None = None) -> None:
+    """Add a page number field to a paragraph, optionally styled.
 
+    Args:
+        paragraph: Paragraph to append the field run to.
+        color: Optional hex font color of the page number.
+        size: Optional font size in points.
+    """
     run = paragraph.add_run()
-    fld_char_begin = OxmlElement("w:fldChar")
-    fld_char_begin.set(qn("w:fldCharType"), "begin")
-
-    instr_text = OxmlElement("w:instrText")
-    instr_text.set(qn("xml:space"), "preserve")
-    instr_text.text = "PAGE"
-
-    fld_char_separate = OxmlElement("w:fldChar")
-    fld_char_separate.set(qn("w:fldCharType"), "separate")
-
-    fld_char_end = OxmlElement("w:fldChar")
-    fld_char_end.set(qn("w:fldCharType"), "end")
-
-    run._r.append(fld_char_begin)
-    run._r.append(instr_text)
-    run._r.append(fld_char_separate)
-    run._r.append(fld_char_end)
+    if size is not None:
+        run.font.size = Pt(size)
+    if color is not None:
+        run.font.color.rgb = RGBColor.from_string(color)
+    run._r.extend(list(deepcopy(_PAGE_FIELD_RUN)))
 
 
 def create_professional_template(output_path: Path | str | None = None) -> Path:
@@ -223,7 +275,13 @@ def create_professional_template(output_path: Path | str | None = None) -> Path:
         output_path = Path(output_path)
 
     ensure_dir(output_path.parent)
+    output_path.write_bytes(_get_template_bytes("professional", _build_professional_template))
+
+    return output_path
+
 
+def _build_professional_template() -> bytes:
+    """Build the professional template and return its saved bytes."""
     doc = Document()
 
     # Configure document margins (narrower for more content)
@@ -245,10 +303,7 @@ def create_professional_template(output_path: Path | str | None = None) -> Path:
     _configure_professional_header(doc)
     _configure_professional_footer(doc)
 
-    # Save the template
-    doc.save(output_path)
-
-    return output_path
+    return _save_bytes(doc)
 
 
 def _configure_professional_normal(doc: Document) -> None:
@@ -269,24 +324,11 @@ def _configure_professional_normal(doc: Document) -> None:
 def _configure_professional_headings(doc: Document) -> None:
     """Configure professional heading styles."""
     styles = doc.styles
+    existing = {style.name: style for style in styles}
 
-    # Professional color scheme - dark blue gradient
-    heading_config = [
-        # (level, font_size, bold, color, space_before, space_after, font_name)
-        (1, 28, True, "1B4F72", 24, 12, "Calibri Light"),
-        (2, 22, True, "1F618D", 18, 10, "Calibri Light"),
-        (3, 16, True, "2874A6", 14, 8, "Calibri"),
-        (4, 13, True, "2E86C1", 12, 6, "Calibri"),
-        (5, 12, True, "3498DB", 10, 4, "Calibri"),
-        (6, 11, True, "5DADE2", 8, 4, "Calibri"),
-    ]
-
-    for level, size, bold, color, space_before, space_after, font_name in heading_config:
+    for level, size, bold, color, space_before, space_after, font_name in _PROFESSIONAL_HEADINGS:
         style_name = f"Heading {level}"
-        try:
-            style = styles[style_name]
-        except KeyError:
-            style = styles.add_style(style_name, WD_STYLE_TYPE.PARAGRAPH)
+        style = _get_or_add_style(styles, existing, style_name, WD_STYLE_TYPE.PARAGRAPH)
 
         style.font.name = font_name
         style.font.size = Pt(size)
@@ -304,35 +346,23 @@ def _configure_professional_headings(doc: Document) -> None:
 def _add_paragraph_border(style, position: str, color: str, size: int) -> None:
     """Add a border to a paragraph style."""
     pPr = style._element.get_or_add_pPr()
-    pBdr = OxmlElement("w:pBdr")
-    border = OxmlElement(f"w:{position}")
-    border.set(qn("w:val"), "single")
-    border.set(qn("w:sz"), str(size))
-    border.set(qn("w:color"), color)
-    border.set(qn("w:space"), "4")
-    pBdr.append(border)
-    pPr.append(pBdr)
+    pPr.append(_parse_paragraph_border(position, color, size))
 
 
 def _configure_professional_code_styles(doc: Document) -> None:
     """Configure professional code styles with background shading."""
     styles = doc.styles
+    existing = {style.name: style for style in styles}
 
     # Inline code character style
-    try:
-        code_char = styles["Code Char"]
-    except KeyError:
-        code_char = styles.add_style("Code Char", WD_STYLE_TYPE.CHARACTER)
+    code_char = _get_or_add_style(styles, existing, "Code Char", WD_STYLE_TYPE.CHARACTER)
 
     code_char.font.name = "Consolas"
     code_char.font.size = Pt(10)
     code_char.font.color.rgb = RGBColor.from_string("C7254E")
 
     # Code block paragraph style
-    try:
-        code_block = styles["Code Block"]
-    except KeyError:
-        code_block = styles.add_style("Code Block", WD_STYLE_TYPE.PARAGRAPH)
+    code_block = _get_or_add_style(styles, existing, "Code Block", WD_STYLE_TYPE.PARAGRAPH)
 
     code_block.font.name = "Consolas"
     code_block.font.size = Pt(9.5)
@@ -350,21 +380,16 @@ def _configure_professional_code_styles(doc: Document) -> None:
 def _add_paragraph_shading(style, color: str) -> None:
     """Add background shading to a paragraph style."""
     pPr = style._element.get_or_add_pPr()
-    shd = OxmlElement("w:shd")
-    shd.set(qn("w:val"), "clear")
-    shd.set(qn("w:fill"), color)
-    pPr.append(shd)
+    pPr.append(parse_xml(f'<w:shd {nsdecls("w")} w:val="clear" w:fill="{color}"/>'))
 
 
 def _configure_professional_list_styles(doc: Document) -> None:
     """Configure professional list styles."""
     styles = doc.styles
+    existing = {style.name: style for style in styles}
 
     # List Bullet style - indentation handled by list builder
-    try:
-        list_bullet = styles["List Bullet"]
-    except KeyError:
-        list_bullet = styles.add_style("List Bullet", WD_STYLE_TYPE.PARAGRAPH)
+    list_bullet = _get_or_add_style(styles, existing, "List Bullet", WD_STYLE_TYPE.PARAGRAPH)
 
     list_bullet.font.name = "Calibri"
     list_bullet.font.size = Pt(11)
@@ -372,10 +397,7 @@ def _configure_professional_list_styles(doc: Document) -> None:
     list_bullet.paragraph_format.line_spacing = 1.15
 
     # List Number style - indentation handled by list builder
-    try:
-        list_number = styles["List Number"]
-    except KeyError:
-        list_number = styles.add_style("List Number", WD_STYLE_TYPE.PARAGRAPH)
+    list_number = _get_or_add_style(styles, existing, "List Number", WD_STYLE_TYPE.PARAGRAPH)
 
     list_number.font.name = "Calibri"
     list_number.font.size = Pt(11)
@@ -386,11 +408,9 @@ def _configure_professional_list_styles(doc: Document) -> None:
 def _configure_professional_quote_style(doc: Document) -> None:
     """Configure professional blockquote style."""
     styles = doc.styles
+    existing = {style.name: style for style in styles}
 
-    try:
-        quote = styles["Quote"]
-    except KeyError:
-        quote = styles.add_style("Quote", WD_STYLE_TYPE.PARAGRAPH)
+    quote = _get_or_add_style(styles, existing, "Quote", WD_STYLE_TYPE.PARAGRAPH)
 
     quote.font.name = "Georgia"
     quote.font.size = Pt(11)
@@ -409,12 +429,10 @@ def _configure_professional_quote_style(doc: Document) -> None:
 def _configure_professional_table_style(doc: Document) -> None:
     """Configure professional table style."""
     styles = doc.styles
+    existing = {style.name: style for style in styles}
 
     # Table Grid style usually exists, but we'll configure it
-    try:
-        table_style = styles["Table Grid"]
-    except KeyError:
-        table_style = styles.add_style("Table Grid", WD_STYLE_TYPE.TABLE)
+    table_style = _get_or_add_style(styles, existing, "Table Grid", WD_STYLE_TYPE.TABLE)
 
 
 def _configure_professional_header(doc: Document) -> None:
@@ -446,41 +464,38 @@ def _configure_professional_header(doc: Document) -> None:
 def _add_paragraph_border_simple(paragraph, position: str, color: str, size: int) -> None:
     """Add a border to a paragraph element directly."""
     pPr = paragraph._p.get_or_add_pPr()
-    pBdr = OxmlElement("w:pBdr")
-    border = OxmlElement(f"w:{position}")
-    border.set(qn("w:val"), "single")
-    border.set(qn("w:sz"), str(size))
-    border.set(qn("w:color"), color)
-    border.set(qn("w:space"), "4")
-    pBdr.append(border)
-    pPr.append(pBdr)
+    pPr.append(_parse_paragraph_border(position, color, size))
+
+
+def _parse_paragraph_border(position: str, color: str, size: int):
+    """Build a w:pBdr element holding a single border."""
+    return parse_xml(
+        f'<w:pBdr {nsdecls("w")}><w:{position} w:val="single" w:sz="{size}"'
+        f' w:color="{color}" w:space="4"/></w:pBdr>'
+    )
 
 
 def _remove_table_borders(table) -> None:
     """Remove all borders from a table."""
     tbl = table._tbl
     tbl_pr = tbl.tblPr if tbl.tblPr is not None else OxmlElement("w:tblPr")
-    tbl_borders = OxmlElement("w:tblBorders")
-    for border_name in ["top", "left", "bottom", "right", "insideH", "insideV"]:
-        border = OxmlElement(f"w:{border_name}")
-        border.set(qn("w:val"), "nil")
-        tbl_borders.append(border)
-    tbl_pr.append(tbl_borders)
+    tbl_pr.append(parse_xml(_NO_TABLE_BORDERS_XML))
     if tbl.tblPr is None:
         tbl.insert(0, tbl_pr)
 
 
 def _add_cell_bottom_border(cell, color: str) -> None:
     """Add a bottom border to a table cell."""
-    tc = cell._tc
-    tcPr = tc.get_or_add_tcPr()
-    tcBorders = OxmlElement("w:tcBorders")
-    bottom = OxmlElement("w:bottom")
-    bottom.set(qn("w:val"), "single")
-    bottom.set(qn("w:sz"), "4")
-    bottom.set(qn("w:color"), color)
-    tcBorders.append(bottom)
-    tcPr.append(tcBorders)
+    tcPr = cell._tc.get_or_add_tcPr()
+    tcPr.append(_parse_cell_border("bottom", color))
+
+
+def _parse_cell_border(position: str, color: str):
+    """Build a w:tcBorders element holding a single border."""
+    return parse_xml(
+        f'<w:tcBorders {nsdecls("w")}><w:{position} w:val="single" w:sz="4"'
+        f' w:color="{color}"/></w:tcBorders>'
+    )
 
 
 def _configure_professional_footer(doc: Document) -> None:
@@ -507,45 +522,13 @@ def _configure_professional_footer(doc: Document) -> None:
     run = paragraph.add_run("Page ")
     run.font.size = Pt(9)
     run.font.color.rgb = RGBColor.from_string("999999")
-    _add_page_number_field_styled(paragraph, "999999")
+    _add_page_number_field(paragraph, "999999", 9)
 
 
 def _add_cell_top_border(cell, color: str) -> None:
     """Add a top border to a table cell."""
-    tc = cell._tc
-    tcPr = tc.get_or_add_tcPr()
-    tcBorders = OxmlElement("w:tcBorders")
-    top = OxmlElement("w:top")
-    top.set(qn("w:val"), "single")
-    top.set(qn("w:sz"), "4")
-    top.set(qn("w:color"), color)
-    tcBorders.append(top)
-    tcPr.append(tcBorders)
-
-
-def _add_page_number_field_styled(paragraph, color: str) -> None:
-    """Add a styled page number field to a paragraph."""
-    run = paragraph.add_run()
-    run.font.size = Pt(9)
-    run.font.color.rgb = RGBColor.from_string(color)
-
-    fld_char_begin = OxmlElement("w:fldChar")
-    fld_char_begin.set(qn("w:fldCharType"), "begin")
-
-    instr_text = OxmlElement("w:instrText")
-    instr_text.set(qn("xml:space"), "preserve")
-    instr_text.text = "PAGE"
-
-    fld_char_separate = OxmlElement("w:fldChar")
-    fld_char_separate.set(qn("w:fldCharType"), "separate")
-
-    fld_char_end = OxmlElement("w:fldChar")
-    fld_char_end.set(qn("w:fldCharType"), "end")
-
-    run._r.append(fld_char_begin)
-    run._r.append(instr_text)
-    run._r.append(fld_char_separate)
-    run._r.append(fld_char_end)
+    tcPr = cell._tc.get_or_add_tcPr()
+    tcPr.append(_parse_cell_border("top", color))
 
 
 if __name__ == "__main__":
@@ -2,13 +2,32 @@
 
 from __future__ import annotations
 
+import os
 import shutil
+from collections.abc import Iterable
 from pathlib import Path
 
+import msgspec
+
 from md2office.core.config import get_config
 from md2office.core.exceptions import StorageError, TemplateError
 from md2office.utils.helpers import ensure_dir, get_file_hash, sanitize_filename
 
+# Sidecar file with the known hashes of the templates in a directory
+_INDEX_FILENAME = ".index.json"
+
+
+class _IndexEntry(msgspec.Struct):
+    """Hash of a template file as of a given size and modification time."""
+
+    size: int
+    mtime_ns: int
+    hash: str
+
+
+_index_decoder = msgspec.json.Decoder(dict[str, _IndexEntry])
+_index_encoder = msgspec.json.Encoder()
+
 
 class TemplateStorage:
     """Manages DOCX template storage and retrieval."""
@@ -27,6 +46,8 @@ class TemplateStorage:
             self._templates_dir = Path(config.storage.templates_dir)
 
         ensure_dir(self._templates_dir)
+        # Hash index from _INDEX_FILENAME, loaded on first use
+        self._index: dict[str, _IndexEntry] | None = None
 
     @property
     def templates_dir(self) -> Path:
@@ -40,15 +61,21 @@ class TemplateStorage:
             List of template info dictionaries with name, path, and size.
         """
         templates = []
-        for path in self._templates_dir.glob("*.docx"):
-            templates.append(
-                {
-                    "name": path.stem,
-                    "path": str(path),
-                    "size": path.stat().st_size,
-                    "modified": path.stat().st_mtime,
-                }
-            )
+        # scandir entries give the name and file type without a Path or
+        # fnmatch per entry, and one stat() serves both size and mtime
+        with os.scandir(self._templates_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".docx") or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                templates.append(
+                    {
+                        "name": entry.name[:-5],
+                        "path": entry.path,
+                        "size": stat.st_size,
+                        "modified": stat.st_mtime,
+                    }
+                )
         return sorted(templates, key=lambda x: x["name"])
 
     def get_template_path(self, name: str) -> Path:
@@ -60,6 +87,23 @@ class TemplateStorage:
         Returns:
             Path to the template file.
 
+        Raises:
+            TemplateError: If template not found.
+        """
+        return self._resolve(name)[0]
+
+    def _resolve(self, name: str) -> tuple[Path, os.stat_result]:
+        """Get the path of a template file together with its stat result.
+
+        A single stat() both checks that the template exists and provides
+        its size and modification time.
+
+        Args:
+            name: Template name (with or without .docx extension).
+
+        Returns:
+            Tuple of the template path and its stat result.
+
         Raises:
             TemplateError: If template not found.
         """
@@ -68,10 +112,14 @@ class TemplateStorage:
             name = f"{name}.docx"
 
         path = self._templates_dir / name
-        if not path.exists():
-            raise TemplateError(f"Template not found: {name}")
+        try:
+            stat = path.stat()
+        except (OSError, ValueError):
+            # Like Path.exists(): missing, unreachable (e.g. ELOOP) and invalid
+            # names (e.g. embedded NUL) all mean the template is not there
+            raise TemplateError(f"Template not found: {name}") from None
 
-        return path
+        return path, stat
 
     def template_exists(self, name: str) -> bool:
         """Check if a template exists.
@@ -108,6 +156,68 @@ class TemplateStorage:
             TemplateError: If template exists and overwrite is False.
         """
         source_path = Path(source_path)
+        name = self._target_name(source_path, name)
+        target_path = self._templates_dir / name
+
+        if target_path.exists() and not overwrite:
+            raise TemplateError(f"Template already exists: {name}")
+
+        self._copy_templates([(source_path, target_path)])
+        return target_path
+
+    def add_templates(
+        self,
+        source_paths: Iterable[Path | str],
+        overwrite: bool = False,
+    ) -> list[Path]:
+        """Add several templates to storage, named after their source files.
+
+        All sources are checked before any file is copied, against a single
+        listing of the templates directory.
+
+        Args:
+            source_paths: Paths to the source DOCX files.
+            overwrite: Whether to overwrite existing templates.
+
+        Returns:
+            Paths to the stored templates, in source order.
+
+        Raises:
+            StorageError: If a source is missing or a file operation fails.
+            TemplateError: If a template exists and overwrite is False, or two
+                sources have the same name.
+        """
+        with os.scandir(self._templates_dir) as entries:
+            existing = {entry.name for entry in entries}
+
+        copies: list[tuple[Path, Path]] = []
+        names: set[str] = set()
+        for source_path in map(Path, source_paths):
+            name = self._target_name(source_path, None)
+            if name in names:
+                raise TemplateError(f"Duplicate template name: {name}")
+            if name in existing and not overwrite:
+                raise TemplateError(f"Template already exists: {name}")
+            names.add(name)
+            copies.append((source_path, self._templates_dir / name))
+
+        self._copy_templates(copies)
+        return [target_path for _, target_path in copies]
+
+    def _target_name(self, source_path: Path, name: str | None) -> str:
+        """Get the stored file name of a template to add.
+
+        Args:
+            source_path: Path to the source DOCX file.
+            name: Optional name for the template.
+
+        Returns:
+            Template file name, with .docx extension.
+
+        Raises:
+            StorageError: If the source file does not exist.
+            TemplateError: If the source is not a .docx file.
+        """
         if not source_path.exists():
             raise StorageError(f"Source file not found: {source_path}")
 
@@ -119,19 +229,29 @@ class TemplateStorage:
             name = sanitize_filename(name)
             if not name.endswith(".docx"):
                 name = f"{name}.docx"
-        else:
-            name = source_path.name
+            return name
+        return source_path.name
 
-        target_path = self._templates_dir / name
+    def _copy_templates(self, copies: list[tuple[Path, Path]]) -> None:
+        """Copy template files into storage and drop their stale index entries.
 
-        if target_path.exists() and not overwrite:
-            raise TemplateError(f"Template already exists: {name}")
+        Args:
+            copies: (source path, target path) pairs.
 
+        Raises:
+            StorageError: If a file operation fails.
+        """
+        index = self._load_index()
+        stale = False
         try:
-            shutil.copy2(source_path, target_path)
-            return target_path
+            for source_path, target_path in copies:
+                shutil.copyfile(source_path, target_path)
+                stale = index.pop(target_path.name, None) is not None or stale
         except OSError as e:
             raise StorageError(f"Failed to copy template: {e}") from e
+        finally:
+            if stale:
+                self._save_index()
 
     def remove_template(self, name: str) -> bool:
         """Remove a template from storage.
@@ -149,10 +269,14 @@ class TemplateStorage:
 
         try:
             path.unlink()
-            return True
         except OSError as e:
             raise StorageError(f"Failed to remove template: {e}") from e
 
+        index = self._load_index()
+        if index.pop(path.name, None) is not None:
+            self._save_index()
+        return True
+
     def get_template_info(self, name: str) -> dict:
         """Get information about a template.
 
@@ -165,13 +289,58 @@ class TemplateStorage:
         Raises:
             TemplateError: If template not found.
         """
-        path = self.get_template_path(name)
-        stat = path.stat()
+        path, stat = self._resolve(name)
 
         return {
             "name": path.stem,
             "path": str(path),
             "size": stat.st_size,
             "modified": stat.st_mtime,
-            "hash": get_file_hash(path),
+            "hash": self._get_hash(path, stat),
         }
+
+    def _get_hash(self, path: Path, stat: os.stat_result) -> str:
+        """Get the hash of a template, reading the file only if it changed.
+
+        Hashes are kept in an index file in the templates directory, so even
+        a fresh process skips hashing templates that have not changed.
+
+        Args:
+            path: Template path.
+            stat: Stat result of the template.
+
+        Returns:
+            Hexadecimal SHA-256 hash string.
+        """
+        index = self._load_index()
+        entry = index.get(path.name)
+        if entry is not None and entry.size == stat.st_size and entry.mtime_ns == stat.st_mtime_ns:
+            return entry.hash
+
+        digest = get_file_hash(path)
+        index[path.name] = _IndexEntry(stat.st_size, stat.st_mtime_ns, digest)
+        self._save_index()
+        return digest
+
+    def _load_index(self) -> dict[str, _IndexEntry]:
+        """Load the hash index, starting empty if it is missing or invalid."""
+        if self._index is None:
+            try:
+                data = (self._templates_dir / _INDEX_FILENAME).read_bytes()
+                self._index = _index_decoder.decode(data)
+            except (OSError, msgspec.DecodeError):
+                self._index = {}
+        return self._index
+
+    def _save_index(self) -> None:
+        """Write the hash index atomically.
+
+        The index is only a cache: failing to write it (e.g. in a read-only
+        templates directory) is not an error.
+        """
+        tmp_path = self._templates_dir / f"{_INDEX_FILENAME}.{os.getpid()}.tmp"
+        try:
+            tmp_path.write_bytes(_index_encoder.encode(self._index))
+            os.replace(tmp_path, self._templates_dir / _INDEX_FILENAME)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
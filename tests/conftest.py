@@ -8,6 +8,23 @@ from pathlib import Path
 import pytest
 
 
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """Skip the benchmarks by default; --benchmark-only runs them."""
+    if config.pluginmanager.hasplugin("benchmark"):
+        config.option.benchmark_skip = True
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the benchmarks when pytest-benchmark is not available."""
+    if config.pluginmanager.hasplugin("benchmark"):
+        return
+    skip = pytest.mark.skip(reason="pytest-benchmark is not available")
+    for item in items:
+        if "benchmark" in getattr(item, "fixturenames", ()):
+            item.add_marker(skip)
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for test files."""
@@ -84,3 +101,14 @@ def template_variables():
         "author": "Test Author",
         "date": "2026-01-18",
     }
+
+
+@pytest.fixture(scope="session")
+def client():
+    """API test client, started once for the whole session."""
+    from litestar.testing import TestClient
+
+    from md2office.main import app
+
+    with TestClient(app=app) as test_client:
+        yield test_client
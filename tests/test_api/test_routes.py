@@ -2,67 +2,64 @@
 
 from __future__ import annotations
 
-from litestar.testing import TestClient
-
-from md2office.main import app
-
 
 class TestHealthEndpoint:
     """Tests for health check endpoint."""
 
-    def test_health_check(self):
+    def test_health_check(self, client):
         """Test health check returns healthy status."""
-        with TestClient(app=app) as client:
-            response = client.get("/health")
-            assert response.status_code == 200
-            data = response.json()
-            assert data["status"] == "healthy"
-            assert "version" in data
+        response = client.get("/health")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "healthy"
+        assert "version" in data
 
 
 class TestConvertEndpoint:
     """Tests for conversion endpoints."""
 
-    def test_convert_simple_markdown(self):
+    def test_convert_simple_markdown(self, client):
         """Test converting simple markdown."""
-        with TestClient(app=app) as client:
-            response = client.post(
-                "/api/v1/convert",
-                json={
-                    "markdown": "# Hello\n\nWorld",
-                    "filename": "test.docx",
-                },
-            )
-            assert response.status_code == 200
-            assert response.headers["content-type"] == (
-                "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-            )
-            # Check for DOCX magic bytes
-            assert response.content[:2] == b"PK"
+        response = client.post(
+            "/api/v1/convert",
+            json={
+                "markdown": "# Hello\n\nWorld",
+                "filename": "test.docx",
+            },
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == (
+            "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+        )
+        # Check for DOCX magic bytes
+        assert response.content[:2] == b"PK"
 
-    def test_convert_with_variables(self):
+    def test_convert_with_variables(self, client):
         """Test converting with template variables."""
-        with TestClient(app=app) as client:
-            response = client.post(
-                "/api/v1/convert",
-                json={
-                    "markdown": "# {{title}}\n\nBy {{author}}",
-                    "variables": {"title": "Test", "author": "Tester"},
-                    "filename": "test.docx",
-                },
-            )
-            assert response.status_code == 200
+        response = client.post(
+            "/api/v1/convert",
+            json={
+                "markdown": "# {{title}}\n\nBy {{author}}",
+                "variables": {"title": "Test", "author": "Tester"},
+                "filename": "test.docx",
+            },
+        )
+        assert response.status_code == 200
 
 
 class TestTemplatesEndpoint:
     """Tests for template management endpoints."""
 
-    def test_list_templates(self):
+    def test_list_templates(self, client):
         """Test listing templates."""
-        with TestClient(app=app) as client:
-            response = client.get("/api/v1/templates")
-            assert response.status_code == 200
-            data = response.json()
-            assert "templates" in data
-            assert "count" in data
-            assert isinstance(data["templates"], list)
+        response = client.get("/api/v1/templates")
+        assert response.status_code == 200
+        data = response.json()
+        assert "templates" in data
+        assert "count" in data
+        assert isinstance(data["templates"], list)
+
+    def test_get_template_invalid_name(self, client):
+        """Test a template name with an embedded NUL is a 400, not a 500."""
+        response = client.get("/api/v1/templates/a%00b")
+        assert response.status_code == 400
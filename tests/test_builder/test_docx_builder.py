@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import base64
+
 from md2office.builder import DocxBuilder
 from md2office.parser import (
     DocxCodeBlock,
     DocxHeading,
+    DocxImage,
     DocxList,
     DocxListItem,
     DocxParagraph,
@@ -16,6 +19,11 @@ from md2office.parser import (
     TextSpan,
 )
 
+# 1x1 transparent PNG
+PNG_BYTES = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+)
+
 
 class TestDocxBuilder:
     """Tests for DocxBuilder class."""
@@ -111,6 +119,42 @@ class TestDocxBuilder:
         assert len(doc.tables[0].rows) == 2
         assert len(doc.tables[0].columns) == 2
 
+    def test_build_table_merges(self):
+        """Test merge markers produce the same merges with or without masks."""
+        md = "| A | B | C |\n|---|---|---|\n| 1 | 2 | >> |\n| ^^ | 5 | >> |"
+        parsed = self.parser.parse(md)[0]
+        # Same table with only the per-cell flags set
+        unmasked = DocxTable(
+            rows=[DocxTableRow(cells=row.cells) for row in parsed.rows],
+            has_header=True,
+        )
+
+        for table_element in (parsed, unmasked):
+            doc = DocxBuilder().build([table_element])
+            table = doc.tables[0]
+            # Horizontal merges extend the cell to their left
+            assert table.cell(1, 1)._tc is table.cell(1, 2)._tc
+            assert table.cell(2, 1)._tc is table.cell(2, 2)._tc
+            assert table.cell(1, 0)._tc is not table.cell(1, 1)._tc
+            # Vertical merge spans rows 1-2 in the first column
+            assert table.cell(2, 0).text == "1"
+
+    def test_build_repeated_image(self, temp_dir):
+        """Test repeated images share a single image part."""
+        image_path = temp_dir / "pixel.png"
+        image_path.write_bytes(PNG_BYTES)
+        elements = [DocxImage(src=str(image_path)) for _ in range(3)]
+
+        doc = self.builder.build(elements)
+
+        assert len(doc.inline_shapes) == 3
+        image_rels = {
+            rel.target_part
+            for rel in doc.part.rels.values()
+            if rel.reltype.endswith("/image")
+        }
+        assert len(image_rels) == 1
+
     def test_build_to_bytes(self):
         """Test building document to bytes."""
         elements = [
@@ -0,0 +1,61 @@
+"""Parser throughput benchmarks.
+
+Skipped by default, and when pytest-benchmark is not available (see
+tests/conftest.py). Run them with::
+
+    uv run pytest --benchmark-only
+
+and in CI save a baseline and compare against it::
+
+    uv run pytest --benchmark-only --benchmark-autosave
+    uv run pytest --benchmark-only --benchmark-compare --benchmark-compare-fail=mean:10%
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from md2office.parser import MarkdownParser
+
+
+@pytest.fixture(scope="module")
+def big_markdown():
+    """A large document: a mixed-content section repeated 1000 times."""
+    section = """## Section
+
+A paragraph with **bold**, *italic*, `code` and a [link](https://example.com).
+
+- Item one
+- Item two
+
+| A | B |
+|---|---|
+| 1 | 2 |
+
+```python
+print("hello")
+```
+
+> [!NOTE]
+> A note.
+
+"""
+    return section * 1000
+
+
+class TestParserBenchmark:
+    """Benchmarks for MarkdownParser."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.parser = MarkdownParser()
+
+    def test_parse_sample_throughput(self, benchmark, sample_markdown):
+        """Benchmark parsing the sample document."""
+        elements = benchmark(self.parser.parse, sample_markdown)
+        assert elements
+
+    def test_parse_large_throughput(self, benchmark, big_markdown):
+        """Benchmark parsing a large document."""
+        elements = benchmark(self.parser.parse, big_markdown)
+        assert len(elements) == 6000
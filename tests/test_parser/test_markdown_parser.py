@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import mistune
+
 from md2office.parser import (
     DocxAdmonition,
     DocxBlockquote,
@@ -10,8 +12,11 @@ from md2office.parser import (
     DocxHorizontalRule,
     DocxList,
     DocxParagraph,
+    DocxRenderer,
     DocxTable,
     MarkdownParser,
+    decode_document,
+    encode_document,
 )
 
 
@@ -46,6 +51,11 @@ class TestMarkdownParser:
         assert len(elements) == 2
         assert all(isinstance(e, DocxParagraph) for e in elements)
 
+    def test_parse_plain_text(self):
+        """Test plain one-line text parses like it does through mistune."""
+        for md in ("Just some text, 100% plain.", "1 plain line", "Tom & Jerry"):
+            assert self.parser.parse(md) == self.parser.parse(md + "\n")
+
     def test_parse_bold_italic(self):
         """Test parsing bold and italic text."""
         md = "This is **bold** and *italic* text."
@@ -118,6 +128,20 @@ class TestMarkdownParser:
         assert len(table.rows) == 3  # Header + 2 data rows
         assert table.has_header
 
+    def test_parse_table_merge_masks(self):
+        """Test merge markers are packed into per-row bitmasks."""
+        md = "| A | B | C |\n|---|---|---|\n| 1 | 2 | >> |\n| ^^ | 5 | >> |"
+        elements = self.parser.parse(md)
+
+        table = elements[0]
+        assert isinstance(table, DocxTable)
+        assert table.rows[0].vmerge_mask == 0
+        assert table.rows[0].hmerge_mask == 0
+        assert table.rows[1].hmerge_mask == 0b100
+        assert table.rows[2].vmerge_mask == 0b001
+        assert table.rows[2].hmerge_mask == 0b100
+        assert table.rows[1].cells[2].merge_left
+
     def test_parse_blockquote(self):
         """Test parsing blockquotes."""
         md = "> This is a quote."
@@ -148,6 +172,16 @@ class TestMarkdownParser:
         assert isinstance(admonition, DocxAdmonition)
         assert admonition.admonition_type == "WARNING"
 
+    def test_parse_admonition_keeps_inline_spacing(self):
+        """Test admonition content after the marker keeps its spacing."""
+        md = "> [!NOTE]\n> This is a *note* here."
+        elements = self.parser.parse(md)
+
+        admonition = elements[0]
+        assert isinstance(admonition, DocxAdmonition)
+        para = admonition.children[0]
+        assert "".join(span.text for span in para.content) == "This is a note here."
+
     def test_parse_horizontal_rule(self):
         """Test parsing horizontal rules."""
         md = "Text above\n\n---\n\nText below"
@@ -168,6 +202,21 @@ class TestMarkdownParser:
         assert link_spans[0].link == "https://example.com"
         assert link_spans[0].text == "here"
 
+    def test_parse_merges_adjacent_spans(self):
+        """Test adjacent spans with the same formatting are merged."""
+        md = "a [b c *d* e"
+        elements = self.parser.parse(md)
+
+        spans = elements[0].content
+        assert [span.text for span in spans] == ["a [b c ", "d", " e"]
+        assert spans[1].italic
+
+    def test_parse_keeps_breaks_separate(self):
+        """Test line breaks stay separate spans, inside formatting too."""
+        for md in ("a  \nb", "**a  \nb**"):
+            spans = self.parser.parse(md)[0].content
+            assert [span.text for span in spans] == ["a", "\n", "b"]
+
     def test_parse_empty_content(self):
         """Test parsing empty content."""
         elements = self.parser.parse("")
@@ -185,3 +234,48 @@ class TestMarkdownParser:
         assert DocxList in element_types
         assert DocxCodeBlock in element_types
         assert DocxTable in element_types
+
+    def test_iter_elements_matches_parse(self, sample_markdown):
+        """Test streaming parse yields the same elements as parse()."""
+        stream = self.parser.iter_elements(sample_markdown)
+        assert not isinstance(stream, list)
+        assert list(stream) == self.parser.parse(sample_markdown)
+
+    def test_document_json_round_trip(self, sample_markdown):
+        """Test a parsed document survives JSON encoding and decoding."""
+        md = sample_markdown + "\n> [!NOTE]\n> Nested *note*.\n"
+        elements = self.parser.parse(md)
+
+        data = encode_document(elements)
+        assert isinstance(data, bytes)
+        assert decode_document(data) == elements
+
+
+class TestDocxRenderer:
+    """Tests for DocxRenderer class."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.renderer = DocxRenderer()
+        self.md = mistune.create_markdown(renderer="ast", plugins=["table"])
+
+    def test_render_table_header(self):
+        """Test the header row is kept and flagged from the cell attributes."""
+        tokens = self.md("| A | B |\n|---|---|\n| 1 | 2 |\n")
+        table = self.renderer.table(tokens[0], None)
+
+        assert isinstance(table, DocxTable)
+        assert table.has_header
+        assert [[c.is_header for c in row.cells] for row in table.rows] == [
+            [True, True],
+            [False, False],
+        ]
+
+    def test_render_image_alt_from_children(self):
+        """Test image alt text is taken from mistune's inline children."""
+        tokens = self.md('![An *image*](a.png "Title")')
+        image = self.renderer.image(tokens[0]["children"][0], None)
+
+        assert image.src == "a.png"
+        assert image.alt == "An image"
+        assert image.title == "Title"
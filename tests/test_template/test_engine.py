@@ -0,0 +1,78 @@
+"""Tests for the template engine."""
+
+from __future__ import annotations
+
+import pytest
+from docx import Document
+
+from md2office.core.exceptions import TemplateError
+from md2office.template import TemplateEngine, TemplateStorage
+from md2office.template import engine as engine_module
+
+
+class TestTemplateEngine:
+    """Tests for TemplateEngine class."""
+
+    @pytest.fixture(autouse=True)
+    def setup_engine(self, temp_dir):
+        """Set up test fixtures."""
+        self.engine = TemplateEngine(TemplateStorage(temp_dir))
+
+    def test_render_jinja_string_reuses_compiled_template(self, temp_dir):
+        """Test renders of one string compile it only once, across engines."""
+        template_str = "# {{ title }}"
+
+        assert self.engine.render_jinja_string(template_str, {"title": "A"}) == "# A"
+        compiled = engine_module._get_string_template(template_str)
+        other = TemplateEngine(TemplateStorage(temp_dir))
+        assert other.render_jinja_string(template_str, {"title": "B"}) == "# B"
+        assert engine_module._get_string_template(template_str) is compiled
+
+    def test_render_jinja_string_large_not_cached(self):
+        """Test document-sized template strings are not kept in the cache."""
+        template_str = "{{ title }}\n" + "x" * engine_module._TEMPLATE_CACHE_MAX_SOURCE
+
+        assert self.engine.render_jinja_string(template_str, {"title": "A"}).startswith("A\n")
+        assert template_str not in engine_module._template_cache
+
+    def test_precompile(self, temp_dir):
+        """Test precompiled templates are served to other engines from the cache."""
+        template_str = "{{ a }} and {{ b }}"
+        self.engine.precompile([template_str])
+        compiled = engine_module._template_cache[template_str]
+
+        TemplateEngine(TemplateStorage(temp_dir)).render_jinja_string(template_str, {})
+        assert engine_module._template_cache[template_str] is compiled
+        with pytest.raises(TemplateError):
+            self.engine.precompile(["{% if %}"])
+
+    def test_inject_variables(self):
+        """Test placeholders are replaced and unknown ones are kept."""
+        document = Document()
+        document.add_paragraph("By {{ author }} on {{date}}, v{{ version }} {{ unknown }}")
+
+        self.engine.inject_variables(document, {"author": "Ada", "date": "today", "version": 2})
+
+        assert document.paragraphs[-1].text == "By Ada on today, v2 {{ unknown }}"
+        assert self.engine.extract_variables(document) == {"unknown"}
+
+    def test_inject_variables_linked_header_once(self):
+        """Test a header shared by linked sections is processed once."""
+        document = Document()
+        document.sections[0].header.paragraphs[0].text = "{{ a }}"
+        document.add_section()
+
+        self.engine.inject_variables(document, {"a": "{{ b }}", "b": "twice"})
+
+        assert document.sections[0].header.paragraphs[0].text == "{{ b }}"
+
+    def test_inject_variables_merged_cell_once(self):
+        """Test a merged table cell is substituted once, not once per grid column."""
+        document = Document()
+        table = document.add_table(rows=1, cols=2)
+        cell = table.cell(0, 0).merge(table.cell(0, 1))
+        cell.paragraphs[0].text = "{{ a }}"
+
+        self.engine.inject_variables(document, {"a": "{{ b }}", "b": "B"})
+
+        assert cell.paragraphs[0].text == "{{ b }}"
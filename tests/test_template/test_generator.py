@@ -0,0 +1,20 @@
+"""Tests for the default template generators."""
+
+from __future__ import annotations
+
+from docx import Document
+
+from md2office.template.generator import create_default_template, create_professional_template
+
+
+class TestTemplateGenerator:
+    """Tests for template generator functions."""
+
+    def test_create_templates_repeatedly(self, temp_dir):
+        """Test repeated creation writes the same loadable template."""
+        for create in (create_default_template, create_professional_template):
+            first = create(temp_dir / f"{create.__name__}-1.docx")
+            second = create(temp_dir / f"{create.__name__}-2.docx")
+
+            assert first.read_bytes() == second.read_bytes()
+            assert "Heading 1" in [style.name for style in Document(second).styles]
@@ -0,0 +1,95 @@
+"""Tests for template storage."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+
+import pytest
+
+from md2office.core.exceptions import TemplateError
+from md2office.template import TemplateStorage
+
+
+class TestTemplateStorage:
+    """Tests for TemplateStorage class."""
+
+    def test_get_template_info_hash_follows_changes(self, temp_dir):
+        """Test the cached template hash is recomputed when the file changes."""
+        storage = TemplateStorage(temp_dir)
+        path = temp_dir / "report.docx"
+        path.write_bytes(b"first")
+
+        info = storage.get_template_info("report")
+        assert info["hash"] == hashlib.sha256(b"first").hexdigest()
+        assert storage.get_template_info("report")["hash"] == info["hash"]
+
+        path.write_bytes(b"second!")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert storage.get_template_info("report")["hash"] == hashlib.sha256(b"second!").hexdigest()
+
+    def test_list_templates(self, temp_dir):
+        """Test only .docx files are listed, sorted by name."""
+        storage = TemplateStorage(temp_dir)
+        (temp_dir / "b.docx").write_bytes(b"bb")
+        (temp_dir / "a.docx").write_bytes(b"a")
+        (temp_dir / "notes.txt").write_bytes(b"x")
+        (temp_dir / "folder.docx").mkdir()
+
+        templates = storage.list_templates()
+
+        assert [t["name"] for t in templates] == ["a", "b"]
+        assert templates[1]["path"] == str(temp_dir / "b.docx")
+        assert templates[1]["size"] == 2
+
+    def test_get_template_info_missing(self, temp_dir):
+        """Test info on a missing template raises TemplateError."""
+        storage = TemplateStorage(temp_dir)
+
+        with pytest.raises(TemplateError, match="missing.docx"):
+            storage.get_template_info("missing")
+
+    def test_get_template_path_invalid_name(self, temp_dir):
+        """Test names the filesystem rejects are reported as not found."""
+        storage = TemplateStorage(temp_dir)
+        (temp_dir / "loop.docx").symlink_to(temp_dir / "loop.docx")
+
+        for name in ("a\x00b", "loop"):
+            with pytest.raises(TemplateError, match="Template not found"):
+                storage.get_template_path(name)
+            with pytest.raises(TemplateError, match="Template not found"):
+                storage.get_template_info(name)
+
+    def test_get_template_info_hash_index(self, temp_dir, monkeypatch):
+        """Test a new storage takes unchanged template hashes from the index."""
+        (temp_dir / "report.docx").write_bytes(b"content")
+        digest = TemplateStorage(temp_dir).get_template_info("report")["hash"]
+        assert (temp_dir / ".index.json").exists()
+
+        def fail(*_args, **_kwargs):
+            raise AssertionError("template was hashed again")
+
+        monkeypatch.setattr("md2office.template.storage.get_file_hash", fail)
+        storage = TemplateStorage(temp_dir)
+
+        assert storage.get_template_info("report")["hash"] == digest
+        assert [t["name"] for t in storage.list_templates()] == ["report"]
+
+    def test_add_templates(self, temp_dir):
+        """Test bulk add copies all sources and checks them all first."""
+        storage = TemplateStorage(temp_dir / "store")
+        sources = []
+        for name in ("a", "b"):
+            source = temp_dir / f"{name}.docx"
+            source.write_bytes(name.encode())
+            sources.append(source)
+
+        paths = storage.add_templates(sources)
+
+        assert [path.read_bytes() for path in paths] == [b"a", b"b"]
+        (temp_dir / "c.docx").write_bytes(b"c")
+        with pytest.raises(TemplateError, match="already exists"):
+            storage.add_templates([temp_dir / "c.docx", sources[0]])
+        assert not storage.template_exists("c")